@@ -16,6 +16,7 @@ Contains core data structures and logic for Battleship, including:
 
 """
 
+import functools
 import random
 
 from . import config as _cfg
@@ -52,6 +53,10 @@ class Board:
         # display_grid is what the player or an observer sees (no 'S')
         self.display_grid = [["." for _ in range(size)] for _ in range(size)]
         self.placed_ships: list[dict[str, set[tuple[int, int]]]] = []  # type: ignore[arg-type]
+        # Rendered grid rows keyed by *reveal*; dropped whenever a cell changes
+        self._render_cache: dict[bool, list[str]] = {}
+        # Bit r*size+c is set for every registered ship cell not yet hit
+        self._afloat: int = 0
 
     # ... existing code ...
 
@@ -67,12 +72,7 @@ class Board:
                 if self.can_place_ship(row, col, ship_size, orientation):
                     letter = SHIP_LETTERS[ship_name]
                     occupied_positions = self.do_place_ship(row, col, ship_size, orientation, letter)
-                    self.placed_ships.append(
-                        {
-                            "name": ship_name,
-                            "positions": occupied_positions,
-                        }
-                    )
+                    self._register_ship(ship_name, occupied_positions)
                     placed = True
 
     # ... existing code ...
@@ -104,18 +104,19 @@ class Board:
                 if self.can_place_ship(row, col, ship_size, orientation):
                     letter = SHIP_LETTERS[ship_name]
                     occupied_positions = self.do_place_ship(row, col, ship_size, orientation, letter)
-                    self.placed_ships.append(
-                        {
-                            "name": ship_name,
-                            "positions": occupied_positions,
-                        }
-                    )
+                    self._register_ship(ship_name, occupied_positions)
                     break
                 else:
                     print(f"  [!] Cannot place {ship_name} at {coord_str} (orientation={orientation_str}). Try again.")
 
     # ... existing code ...
 
+    def _register_ship(self, name, positions):
+        """Record a placed ship so hits on it count towards sinking the fleet."""
+        self.placed_ships.append({"name": name, "positions": positions})
+        for r, c in positions:
+            self._afloat |= 1 << (r * self.size + c)
+
     def can_place_ship(self, row, col, ship_size, orientation):
         """Return `True` if a ship of *ship_size* fits at (*row*,*col*)."""
         if orientation == 0:  # Horizontal
@@ -141,6 +142,7 @@ class Board:
     def do_place_ship(self, row, col, ship_size, orientation, letter: str = "S"):
         """Mutating helper that writes ship cells into *hidden_grid* and returns occupied set."""
         occupied = set()
+        self._render_cache.clear()
         if orientation == 0:
             for c in range(col, col + ship_size):
                 self.hidden_grid[row][c] = letter
@@ -157,13 +159,16 @@ class Board:
         """Process a shot at (*row*,*col*) and return (result, sunk_name)."""
         cell = self.hidden_grid[row][col]
         if cell not in {".", "o", "X"}:
+            self._render_cache.clear()
             self.hidden_grid[row][col] = "X"
             self.display_grid[row][col] = "X"
+            self._afloat &= ~(1 << (row * self.size + col))
             if sunk_ship_name := self._mark_hit_and_check_sunk(row, col):
                 return ("hit", sunk_ship_name)
             else:
                 return ("hit", None)
         elif cell == ".":
+            self._render_cache.clear()
             self.hidden_grid[row][col] = "o"
             self.display_grid[row][col] = "o"
             return ("miss", None)
@@ -185,7 +190,7 @@ class Board:
 
     def all_ships_sunk(self):
         """Return True if every ship on this board has been sunk."""
-        return all(len(ship["positions"]) <= 0 for ship in self.placed_ships)
+        return not self._afloat
 
     # ... existing code ...
 
@@ -212,8 +217,12 @@ class Board:
 # ... existing code for parse_coordinate and run_single_player* ...
 
 
+@functools.lru_cache(maxsize=128)
 def parse_coordinate(coord_str):
-    """Translate a Battleship coordinate like 'B7' into a zero-based (row,col) tuple."""
+    """Translate a Battleship coordinate like 'B7' into a zero-based (row,col) tuple.
+
+    Pure and called with a handful of distinct strings, so results are memoised.
+    """
     coord_str = coord_str.strip().upper()
     row_letter = coord_str[0]
     col_digits = coord_str[1:]
@@ -37,7 +37,8 @@ class Cheater:
         self._seeded = False
         self._turn_ready = False
         self._last_rows: list[str] | None = None
-        self._fired: set[str] = set()
+        # Bit r*BOARD_SIZE+c is set once (r, c) has been fired at
+        self._fired: int = 0
         # Keep the user's chosen rate; internal .miss_rate is set at each new match
         self._user_miss_rate = miss_rate
         self.miss_rate = None
@@ -59,7 +60,7 @@ class Cheater:
         if not self._seeded or not self._targets:
             # Start of a new match: reset targets/fired, pick miss_rate
             self._targets.clear()
-            self._fired.clear()
+            self._fired = 0
             # Randomize miss_rate if not explicitly set
             if self._user_miss_rate is None:
                 self.miss_rate = random.random()
@@ -69,8 +70,7 @@ class Cheater:
             for r, line in enumerate(rows):
                 for c, cell in enumerate(line.split()):
                     if cell in _SHIP_CHARS:
-                        coord = f"{chr(ord('A') + r)}{c+1}"
-                        self._targets.append(coord)
+                        self._targets.append((r, c))
             self._seeded = True
 
     def notify_turn(self) -> None:
@@ -93,10 +93,10 @@ class Cheater:
             while True:
                 r = random.randrange(size)
                 c = random.randrange(size)
-                coord = f"{chr(ord('A') + r)}{c+1}"
-                if coord not in self._fired:
-                    self._fired.add(coord)
-                    return coord
+                bit = 1 << (r * size + c)
+                if not self._fired & bit:
+                    self._fired |= bit
+                    return f"{chr(ord('A') + r)}{c+1}"
 
         # If we've run out but have a snapshot, re-seed
         if not self._targets and self._last_rows:
@@ -105,6 +105,6 @@ class Cheater:
             self.feed_grid(self._last_rows or [])
         if not self._targets:
             return None
-        coord = self._targets.popleft()
-        self._fired.add(coord)
-        return coord
+        r, c = self._targets.popleft()
+        self._fired |= 1 << (r * BOARD_SIZE + c)
+        return f"{chr(ord('A') + r)}{c+1}"
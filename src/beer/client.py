@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import socket
 import threading
 from io import BufferedReader, BufferedWriter
@@ -129,6 +130,22 @@ except ImportError:
 _prompt_shown = False
 _spectator_mode = False  # once set, we'll drop any user input
 
+# Connect retries start short so a client launched alongside the server
+# attaches as soon as it binds, then back off to one attempt per second
+_CONNECT_RETRY_MIN = 0.05
+_CONNECT_RETRY_MAX = 1.0
+
+# Server text lines: ANSI colour codes stripped before matching, and the
+# prefixes that are printed (one startswith call per tuple)
+_ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+_SHOWN_PREFIXES = ("INFO ", "ERR ", "[INFO] ", "YOU ", "OPPONENT ", "SUNK ")
+_PROMPT_PREFIXES = (
+    "INFO YOUR TURN",
+    "INFO You have reconnected",
+    "INFO Opponent disconnected",
+    "INFO Opponent has reconnected",
+)
+
 # Client role/turn state (single source of truth from server)
 my_slot: int | None = None       # 1=attacker, 2=defender
 current_turn: int | None = None  # whose turn it currently is
@@ -186,6 +203,24 @@ def _recv_loop(
             if verbose >= 0 and last_own and "grid" not in _cfg.QUIET_CATEGORIES:
                 _print_two_grids(last_opp, last_own, header_left="Opponent Fleet", header_right="Your Fleet")
 
+    def h_cell(obj: dict) -> None:
+        # Apply a one-cell delta to the last full grid we received
+        nonlocal last_own, last_opp
+        own_view = obj.get("view") == "own"
+        rows = last_own if own_view else last_opp
+        if rows is None:
+            return
+        r, c = obj["row"], obj["col"]
+        cells = rows[r].split()
+        cells[c] = "X" if obj.get("state") == "hit" else "o"
+        rows = rows[:r] + [" ".join(cells)] + rows[r + 1 :]
+        if own_view:
+            last_own = rows
+        else:
+            last_opp = rows
+        if verbose >= 0 and last_own and last_opp and "grid" not in _cfg.QUIET_CATEGORIES:
+            _print_two_grids(last_opp, last_own, header_left="Opponent Fleet", header_right="Your Fleet")
+
     def h_shot(obj: dict) -> None:
         if "shot" in _cfg.QUIET_CATEGORIES:
             return
@@ -233,14 +268,22 @@ def _recv_loop(
             print("\n[Opponent Hidden Ships]")
             _print_grid(rows)
 
+    def h_init_state(obj: dict) -> None:
+        # Match start / reconnect snapshot: same views as grid + grid + opp_grid
+        h_grid({"rows": obj["own"]})
+        h_grid({"rows": obj["opp_fog"]})
+        h_opp_grid({"rows": obj["opp_hidden"]})
+
     handlers: Dict[str, Callable[[dict], None]] = {
         "role": h_role,
         "spec_grid": h_spec_grid,
         "grid": h_grid,
+        "cell": h_cell,
         "shot": h_shot,
         "chat": h_chat,
         "end": h_end,
         "opp_grid": h_opp_grid,
+        "init_state": h_init_state,
     }
 
     try:
@@ -279,19 +322,12 @@ def _recv_loop(
                 else:
                     # Fallback: server START/INFO/ERR/SUNK/YOU/OPPONENT lines
                     msg = obj.get("msg", "")
-                    # Strip ANSI escape codes for matching
-                    clean = re.sub(r"\033\[[0-9;]*m", "", msg)
                     if not msg:
                         continue
+                    # Strip ANSI escape codes for matching
+                    clean = _ANSI_RE.sub("", msg) if "\033" in msg else msg
                     # Text we want to show and re-prompt on
-                    if (
-                        clean.startswith("INFO ")
-                        or (clean.startswith("ERR ") and not clean.startswith("ERR Unknown token "))
-                        or clean.startswith("[INFO] ")
-                        or clean.startswith("YOU ")
-                        or clean.startswith("OPPONENT ")
-                        or clean.startswith("SUNK ")
-                    ):
+                    if clean.startswith(_SHOWN_PREFIXES) and not clean.startswith("ERR Unknown token "):
                         # if the server tells us we're spectating, turn on drop mode
                         if clean.startswith("INFO You are now spectating"):
                             _spectator_mode = True
@@ -309,12 +345,7 @@ def _recv_loop(
                         elif clean.startswith("INFO Opponent has reconnected") or clean.startswith("INFO You have reconnected"):
                             _reconnect_waiting = False
                         # Prompt attacker after their turn, rejoin, or opponent disconnect/reconnect
-                        if (
-                            clean.startswith("INFO YOUR TURN") or
-                            clean.startswith("INFO You have reconnected") or
-                            clean.startswith("INFO Opponent disconnected") or
-                            clean.startswith("INFO Opponent has reconnected")
-                        ):
+                        if clean.startswith(_PROMPT_PREFIXES):
                             # Inform cheater it's now our turn
                             if cheat_mode and cheater:
                                 cheater.notify_turn()
@@ -411,9 +442,14 @@ def _client(s, args, cheat_mode: bool = False):
     wfile = s.makefile("w")
     client_seq = 0
     # Retry/connect loop
+    delay = _CONNECT_RETRY_MIN
     while True:
         try:
             s.connect(addr)
+            # Each command is one small frame sent right away; don't let Nagle
+            # hold one back behind the server's delayed ACK
+            with contextlib.suppress(OSError):
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             # Framed handshake: send our TOKEN inside a GAME frame
             io_send(wfile, client_seq, PacketType.GAME, obj={"token": TOKEN})
             client_seq += 1
@@ -423,13 +459,18 @@ def _client(s, args, cheat_mode: bool = False):
             print("\n[INFO] Client exiting.")
             return
         except (ConnectionRefusedError, OSError):
-            print(f"[INFO] Server not ready at {addr}, retrying in 1s…", flush=True)
+            if delay == _CONNECT_RETRY_MIN:
+                print(f"[INFO] Server not ready at {addr}, retrying…", flush=True)
             try:
+                wfile.close()
                 s.close()
             except Exception:
                 pass
+            # Fresh socket and writer: the old writer still wraps the dead socket
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        time.sleep(1)
+            wfile = s.makefile("w")
+        time.sleep(delay)
+        delay = min(delay * 2, _CONNECT_RETRY_MAX)
     stop_evt = threading.Event()
     cheater = Cheater(miss_rate=args.miss_rate, delay=args.delay) if cheat_mode else None
     receiver = threading.Thread(target=_recv_loop, args=(s, stop_evt, _VERBOSE_LEVEL, cheat_mode, cheater), daemon=True)
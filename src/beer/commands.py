@@ -1,8 +1,7 @@
-import re
 from dataclasses import dataclass
-from typing import Union
+from typing import Callable, Dict, List, Union
 
-from .coord_utils import COORD_RE, coord_to_rowcol
+from .coord_utils import format_coord
 
 
 class CommandParseError(Exception):
@@ -27,6 +26,43 @@ class QuitCommand:
 
 Command = Union[ChatCommand, FireCommand, QuitCommand]
 
+# Every legal shot, keyed by its upper-case coordinate. The commands are
+# immutable, so one shared instance per cell replaces validating the
+# coordinate and building a new dataclass on each FIRE.
+_FIRE_COMMANDS: Dict[str, FireCommand] = {
+    format_coord(row, col): FireCommand(row=row, col=col) for row in range(10) for col in range(10)
+}
+_QUIT = QuitCommand()
+
+
+def _parse_chat(raw: str, parts: List[str]) -> Command:
+    if len(parts) < 2 or not parts[1].strip():
+        raise CommandParseError("CHAT requires a non-empty message")
+    return ChatCommand(text=parts[1])
+
+
+def _parse_fire(raw: str, parts: List[str]) -> Command:
+    if len(parts) < 2 or not parts[1].strip():
+        raise CommandParseError("FIRE requires a coordinate")
+    coord = parts[1].strip().upper()
+    cmd = _FIRE_COMMANDS.get(coord)
+    if cmd is None:
+        raise CommandParseError(f"Invalid coordinate: {coord}")
+    return cmd
+
+
+def _parse_quit(raw: str, parts: List[str]) -> Command:
+    if len(parts) != 1:
+        raise CommandParseError(f"Unknown command: {raw}")
+    return _QUIT
+
+
+_PARSERS: Dict[str, Callable[[str, List[str]], Command]] = {
+    "CHAT": _parse_chat,
+    "FIRE": _parse_fire,
+    "QUIT": _parse_quit,
+}
+
 
 def parse_command(line: str) -> Command:
     if line is None:
@@ -35,20 +71,7 @@ def parse_command(line: str) -> Command:
     if not raw:
         raise CommandParseError("Empty command")
     parts = raw.split(maxsplit=1)
-    verb = parts[0].upper()
-    if verb == "CHAT":
-        if len(parts) < 2 or not parts[1].strip():
-            raise CommandParseError("CHAT requires a non-empty message")
-        return ChatCommand(text=parts[1])
-    elif verb == "FIRE":
-        if len(parts) < 2 or not parts[1].strip():
-            raise CommandParseError("FIRE requires a coordinate")
-        coord = parts[1].strip().upper()
-        if not COORD_RE.match(coord):
-            raise CommandParseError(f"Invalid coordinate: {coord}")
-        row, col = coord_to_rowcol(coord)
-        return FireCommand(row=row, col=col)
-    elif verb == "QUIT" and len(parts) == 1:
-        return QuitCommand()
-    else:
+    parser = _PARSERS.get(parts[0].upper())
+    if parser is None:
         raise CommandParseError(f"Unknown command: {raw}")
+    return parser(raw, parts)
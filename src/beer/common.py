@@ -17,10 +17,11 @@ Control frames:
 from __future__ import annotations
 
 import enum
+import functools
 import json
 import struct
 import zlib
-from io import BufferedReader, BufferedWriter
+from io import BufferedIOBase
 from typing import Any, Final, Tuple
 import weakref
 from collections import OrderedDict
@@ -33,18 +34,25 @@ try:
 except ImportError:  # pragma: no cover – crypto optional
     Cipher = None  # type: ignore
 
+_BACKEND = default_backend() if Cipher is not None else None
+
 MAGIC: Final[int] = 0xBEEF  # 2-byte magic; spec says 0xBEER (not valid hex)
 VERSION: Final[int] = 1
 _HEADER_STRUCT = struct.Struct(">HBBII")  # magic(2) ver(1) type(1) seq(4) len(4)
+_CRC_STRUCT = struct.Struct(">I")
 HEADER_LEN = _HEADER_STRUCT.size + 4  # +CRC32
+# The full header as read off the wire, CRC included, decoded in one call
+_FRAME_STRUCT = struct.Struct(">HBBIII")
+# 16-byte AES-CTR IV: the frame seq followed by eight zero bytes
+_NONCE_STRUCT = struct.Struct(">Q8x")
 
 _SECRET_KEY: bytes | None = None
 
 DEFAULT_KEY = _cfg.DEFAULT_KEY
 
-# Retransmit buffer: map each BufferedWriter to its recent {seq: raw_bytes}
+# Retransmit buffer: map each buffered writer to its recent {seq: raw_bytes}
 SEND_BUFFER_WINDOW = 32
-_send_buffers: weakref.WeakKeyDictionary[BufferedWriter, OrderedDict[int, bytes]] = weakref.WeakKeyDictionary()
+_send_buffers: weakref.WeakKeyDictionary[BufferedIOBase, OrderedDict[int, bytes]] = weakref.WeakKeyDictionary()
 
 
 def enable_encryption(key: bytes) -> None:
@@ -57,6 +65,16 @@ def enable_encryption(key: bytes) -> None:
     _SECRET_KEY = key
 
 
+@functools.lru_cache(maxsize=4)
+def _aes(key: bytes) -> Any:
+    return algorithms.AES(key)
+
+
+def _ctr_cipher(seq: int) -> Any:
+    """AES-CTR cipher for frame *seq*; only the nonce changes from frame to frame."""
+    return Cipher(_aes(_SECRET_KEY), modes.CTR(_NONCE_STRUCT.pack(seq)), backend=_BACKEND)
+
+
 class PacketType(int, enum.Enum):
     """Enumerate BEER wire-protocol packet categories, including reliability control frames."""
 
@@ -88,8 +106,33 @@ class IncompleteError(FrameError):
 # ---------------------------------------------------------------------------
 
 
-def _crc32(data: bytes) -> int:
-    return zlib.crc32(data) & 0xFFFFFFFF
+# json.dumps builds a fresh encoder whenever separators are passed; keep one
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+# Decode through a bound decoder too: json.loads adds per-call dispatch, and
+# on bytes an encoding sniff, that frames (always UTF-8) never need
+_decode_json = json.JSONDecoder().decode
+
+
+@functools.lru_cache(maxsize=256)
+def _msg_payload(text: str) -> bytes:
+    """Return the compact JSON encoding of ``{"msg": text}``.
+
+    Cached because most server text (turn prompts, INFO/ERR lines) repeats
+    verbatim; the header and CRC still depend on seq and are built per frame.
+    """
+    return b'{"msg":' + json.dumps(text).encode() + b"}"
+
+
+def encode_payload(obj: Any) -> bytes:
+    """Return the compact JSON payload bytes for *obj*, as :func:`pack` would embed them.
+
+    Encode once and pass the result to :func:`pack` (or ``send``) for every
+    recipient when the same object goes out on several streams.
+    """
+    if type(obj) is dict and len(obj) == 1 and type(obj.get("msg")) is str:
+        # Fast path for the common {"msg": text} frame
+        return _msg_payload(obj["msg"])
+    return _encode_json(obj).encode()
 
 
 def pack(ptype: PacketType, seq: int, obj: Any) -> bytes:
@@ -98,48 +141,41 @@ def pack(ptype: PacketType, seq: int, obj: Any) -> bytes:
     Args:
         ptype: PacketType describing the logical payload.
         seq:   Monotonic per-stream sequence number (u32), reused as CTR nonce.
-        obj:   JSON-serialisable Python object to embed as payload.
+        obj:   JSON-serialisable Python object to embed as payload, or the
+               ``bytes`` already produced by :func:`encode_payload`.
 
     Returns:
         Raw bytes ready to send on the wire (header + CRC + payload).
     """
-    payload = json.dumps(obj, separators=(",", ":")).encode()
+    payload = obj if type(obj) is bytes else encode_payload(obj)
     if _SECRET_KEY is not None and Cipher is not None:
-        nonce = struct.pack(">Q", seq) + b"\0" * 8  # 16-byte CTR IV
-        cipher = Cipher(algorithms.AES(_SECRET_KEY), modes.CTR(nonce), backend=default_backend())
-        payload = cipher.encryptor().update(payload)
+        payload = _ctr_cipher(seq).encryptor().update(payload)
     header_no_crc = _HEADER_STRUCT.pack(MAGIC, VERSION, ptype.value, seq, len(payload))
-    crc = _crc32(header_no_crc + payload)
-    return header_no_crc + struct.pack(">I", crc) + payload
+    # Chain the CRC over header then payload rather than concatenating them
+    crc = zlib.crc32(payload, zlib.crc32(header_no_crc)) & 0xFFFFFFFF
+    return b"".join((header_no_crc, _CRC_STRUCT.pack(crc), payload))
 
 
-def _unpack_header(buf: bytes) -> Tuple[int, int, int, int, int]:
-    magic, ver, ptype, seq, length = _HEADER_STRUCT.unpack(buf)
-    return magic, ver, ptype, seq, length
-
-
-def unpack(stream: BufferedReader) -> Tuple[PacketType, int, Any]:
+def unpack(stream: BufferedIOBase) -> Tuple[PacketType, int, Any]:
     """Read one framed packet from *stream* and return (ptype, seq, obj)."""
     # Read fixed header
     hdr = stream.read(HEADER_LEN)
     if len(hdr) < HEADER_LEN:
         raise IncompleteError("stream closed while reading header")
-    magic, ver, ptype_byte, seq, length = _unpack_header(hdr[:-4])
-    crc_expected = struct.unpack(">I", hdr[-4:])[0]
+    magic, ver, ptype_byte, seq, length, crc_expected = _FRAME_STRUCT.unpack(hdr)
     if magic != MAGIC or ver != VERSION:
         raise FrameError("magic/version mismatch")
     payload = stream.read(length)
     if len(payload) < length:
         raise IncompleteError("stream closed while reading payload")
-    crc_actual = _crc32(hdr[:-4] + payload)
+    # Chain the CRC over header then payload instead of concatenating them
+    crc_actual = zlib.crc32(payload, zlib.crc32(memoryview(hdr)[: _HEADER_STRUCT.size])) & 0xFFFFFFFF
     if crc_actual != crc_expected:
         # Sequence number is known from header
         raise CrcError(seq)
     if _SECRET_KEY is not None and Cipher is not None:
-        nonce = struct.pack(">Q", seq) + b"\0" * 8
-        cipher = Cipher(algorithms.AES(_SECRET_KEY), modes.CTR(nonce), backend=default_backend())
-        payload = cipher.decryptor().update(payload)
-    obj = json.loads(payload.decode()) if payload else None
+        payload = _ctr_cipher(seq).decryptor().update(payload)
+    obj = _decode_json(str(payload, "utf-8")) if payload else None
     return PacketType(ptype_byte), seq, obj
 
 
@@ -148,8 +184,12 @@ def unpack(stream: BufferedReader) -> Tuple[PacketType, int, Any]:
 # ---------------------------------------------------------------------------
 
 
-def send_pkt(w: BufferedWriter, ptype: PacketType, seq: int, obj: Any) -> None:
-    """Write a single framed packet to buffered writer *w* and flush."""
+def send_pkt(w: BufferedIOBase, ptype: PacketType, seq: int, obj: Any, *, flush: bool = True) -> None:
+    """Write a single framed packet to buffered writer *w* and flush.
+
+    With ``flush=False`` the frame stays in *w*'s buffer so several frames can
+    go out in one write when the caller flushes.
+    """
     # Prepare frame
     raw = pack(ptype, seq, obj)
     # Stash for possible retransmission
@@ -163,10 +203,11 @@ def send_pkt(w: BufferedWriter, ptype: PacketType, seq: int, obj: Any) -> None:
         buf.popitem(last=False)
     # Send on the wire
     w.write(raw)
-    w.flush()
+    if flush:
+        w.flush()
 
 
-def recv_pkt(r: BufferedReader) -> Tuple[PacketType, int, Any]:
+def recv_pkt(r: BufferedIOBase) -> Tuple[PacketType, int, Any]:
     """Blocking helper that returns the next `(ptype, seq, obj)` tuple from *r*."""
     return unpack(r)
 
@@ -184,7 +225,7 @@ __all__ = [
 ]
 
 
-def handle_control_frame(w: BufferedWriter, ptype: PacketType, seq: int) -> None:
+def handle_control_frame(w: BufferedIOBase, ptype: PacketType, seq: int) -> None:
     """Process ACK/NAK frames on writer *w*: prune on ACK, retransmit on NAK."""
     buf = _send_buffers.get(w)
     if not buf:
@@ -38,6 +38,13 @@ SIMPLE_BOT: bool = os.getenv("BEER_SIMPLE_BOT", "0") == "1"
 #   Example: export BEER_SERVER_POLL_DELAY=0.02
 SERVER_POLL_DELAY: float = float(os.getenv("BEER_SERVER_POLL_DELAY", "0"))
 
+# BEER_SWITCH_INTERVAL: Interpreter thread switch interval (sys.setswitchinterval) for the server.
+#   Defaults to 0.005 seconds, CPython's own default. Game, fanout and accept threads spend most
+#   of their time blocked in socket calls, which release the GIL anyway; a longer interval saves
+#   forced hand-offs in the middle of building a burst of frames, so measure before raising it.
+#   Example: export BEER_SWITCH_INTERVAL=0.02
+SWITCH_INTERVAL: float = float(os.getenv("BEER_SWITCH_INTERVAL", "0.005"))
+
 
 # ===========================================================================
 # Network Defaults
@@ -105,9 +112,10 @@ DEBUG: bool = os.getenv("BEER_DEBUG", "0") == "1"
 
 # BEER_QUIET: Comma-separated list of packet categories that the client/bot should *not* print
 #   when BEER_DEBUG is disabled. Effective for reducing log noise.
-#   Defaults to an empty list (all categories printed).
+#   Defaults to an empty set (all categories printed). A set because the client
+#   checks it for every packet it receives.
 #   Example: export BEER_QUIET="chat,spec_grid"
-QUIET_CATEGORIES: list[str] = os.getenv("BEER_QUIET", "").split(",") if os.getenv("BEER_QUIET") else []
+QUIET_CATEGORIES: frozenset[str] = frozenset(filter(None, os.getenv("BEER_QUIET", "").split(",")))
 
 # ===========================================================================
 # Cryptography Defaults
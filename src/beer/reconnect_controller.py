@@ -2,7 +2,7 @@
 
 import threading
 import socket
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional
 from .io_utils import send as io_send
 import logging
 
@@ -19,6 +19,8 @@ class ReconnectController:
         token1: str,
         token2: str,
         registry: Dict[str, "ReconnectController"],
+        *,
+        on_attach: Optional[Callable[[int], None]] = None,
     ):
         self.timeout = timeout
         # Protect new_sockets for non-blocking rebind
@@ -27,6 +29,9 @@ class ReconnectController:
         self.token1 = token1
         self.token2 = token2
         self.registry = registry
+        # Called with the slot after a socket is stored, so a session blocked
+        # in its poller can pick the new socket up without waiting for input
+        self.on_attach = on_attach
         self.events = {1: threading.Event(), 2: threading.Event()}
         self.new_sockets: Dict[int, socket.socket] = {}
         # Register for reconnect tokens
@@ -41,17 +46,20 @@ class ReconnectController:
         with self._lock:
             sock = self.new_sockets.pop(slot, None)
             if sock:
+                # Consumed here, so a later wait() must not see a stale signal
+                self.events[slot].clear()
                 return True, sock
             return False, None
 
     def wait(self, slot: int) -> bool:
         """
         Notify the survivor and wait up to timeout for reattachment.
-        Returns True if the original player reattached in time.
+        Returns True if the original player reattached in time; the caller
+        swaps in the new socket and tells both sides the match is resuming.
         """
         other = 2 if slot == 1 else 1
         # Log server-side disconnect event
-        logging.info(f"Player {slot} disconnected – waiting up to {self.timeout}s for reconnect")
+        logging.info("Player %s disconnected – waiting up to %ss for reconnect", slot, self.timeout)
         self.notify_fn(slot, f"INFO You have disconnected – reconnect within {self.timeout}s using your token")
         # Notify the surviving player that we're holding the slot
         self.notify_fn(other, f"INFO Opponent disconnected – holding slot for {self.timeout}s")
@@ -59,10 +67,7 @@ class ReconnectController:
         reattached = evt.wait(timeout=self.timeout)
         if reattached:
             # Log server-side reconnection
-            logging.info(f"Player {slot} reconnected successfully")
-            # Acknowledge rejoin to both sides
-            self.notify_fn(other, "INFO Opponent has reconnected – resuming match")
-            self.notify_fn(slot, "INFO You have reconnected – resuming match")
+            logging.info("Player %s reconnected successfully", slot)
             evt.clear()
         return reattached
 
@@ -77,7 +82,11 @@ class ReconnectController:
         else:
             return False
         # Prevent duplicate reconnect attempts on the same slot
-        if slot in self.new_sockets:
+        with self._lock:
+            taken = slot in self.new_sockets
+            if not taken:
+                self.new_sockets[slot] = sock
+        if taken:
             # Token already in use: send error and close new socket
             wfile = sock.makefile("w")
             sent = io_send(wfile, 0, msg="ERR token-in-use")
@@ -90,12 +99,18 @@ class ReconnectController:
                     pass
             sock.close()
             return False
-        # Store new socket and signal waiters
-        self.new_sockets[slot] = sock
+        # Socket stored above; signal waiters
         self.events[slot].set()
+        if self.on_attach is not None:
+            self.on_attach(slot)
         # No flush needed: previous accept loop consumed the handshake
         return True
 
     def take_new_socket(self, slot: int) -> socket.socket:
         """Retrieve and remove the new socket for the given slot."""
         return self.new_sockets.pop(slot)
+
+
+# Registry for PID-based reconnect tokens (maps token to ReconnectController).
+# Lives here so GameSession can import it without a cycle through the server.
+PID_REGISTRY: Dict[str, ReconnectController] = {}
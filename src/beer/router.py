@@ -82,7 +82,8 @@ class EventRouter:
         if ev.type != "line":
             return
         # log chat on server; clients already get it directly from GameSession
-        logger.info(f"\033[32m[CHAT] P{ev.payload['player']}: {ev.payload['msg']}\033[0m")
+        # Lazy %-args: chat can be chatty and INFO is often filtered out
+        logger.info("\033[32m[CHAT] P%s: %s\033[0m", ev.payload["player"], ev.payload["msg"])
 
     def _handle_system(self, ev: Event) -> None:
         # Currently no dedicated SYSTEM packets.
@@ -94,16 +95,16 @@ class EventRouter:
     def _broadcast(self, obj: Any, ptype: PacketType) -> None:
         s = self._s
         # Delegate to io_utils.send, preserving packet type and sequence
-        io_send(s.p1_file_w, s.io_seq, ptype=ptype, obj=obj)
+        io_send(s.p1_io, s.io_seq, ptype=ptype, obj=obj)
         s.io_seq += 1
-        io_send(s.p2_file_w, s.io_seq, ptype=ptype, obj=obj)
+        io_send(s.p2_io, s.io_seq, ptype=ptype, obj=obj)
         s.io_seq += 1
         # Spectators are handled automatically because GameSession mirrors
         # packets written to player streams.
 
     def _unicast(self, player_idx: int, obj: Any) -> None:
         s = self._s
-        w = s.p1_file_w if player_idx == 1 else s.p2_file_w
+        w = s.p1_io if player_idx == 1 else s.p2_io
         # Send only to specified player
         io_send(w, s.io_seq, ptype=PacketType.GAME, obj=obj)
         s.io_seq += 1
@@ -14,18 +14,23 @@ import threading
 import time
 import logging
 import argparse
+import functools
+import queue
+import select
 import signal
-from typing import Optional, Any, Dict, Callable
+from collections import deque
+from io import BufferedRWPair
+from typing import Optional, Any, Dict, Callable, MutableSequence
 import itertools
 
 from .session import GameSession
-from .reconnect_controller import ReconnectController
-from .common import enable_encryption, DEFAULT_KEY, recv_pkt, send_pkt, PacketType
+from .reconnect_controller import PID_REGISTRY
+from .common import enable_encryption, DEFAULT_KEY, pack, recv_pkt, send_pkt, PacketType
 from .battleship import SHIPS
 from . import config as _cfg
 from .events import Event
 from .router import EventRouter
-from .io_utils import send as io_send, grid_rows
+from .io_utils import open_stream
 
 HOST = _cfg.DEFAULT_HOST
 PORT = _cfg.DEFAULT_PORT
@@ -40,13 +45,150 @@ _pid_counter = itertools.count(100000)
 # Initialize module-level logger
 logger = logging.getLogger(__name__)
 
-# Registry for PID-based reconnect tokens (maps token to ReconnectController)
-PID_REGISTRY: dict[str, ReconnectController] = {}
+# Write buffer for the per-socket lobby streams
+_LOBBY_BUFFER = 65536
+# How soon the fanout retries flushing spectators that were not writable
+_FLUSH_RETRY = 0.05
+# Queued by SpectatorFanout.close(): flush, then end the fanout thread
+_STOP = object()
+
+
+def _coalesce(batch: list[tuple[Any, str | None, Any | None]]) -> list[tuple[Any, str | None, Any | None]]:
+    """Drop ``spec_grid`` snapshots superseded by a later one from the same source."""
+    latest: dict[Any, int] = {}
+    for i, (source, _, obj) in enumerate(batch):
+        if isinstance(obj, dict) and obj.get("type") == "spec_grid":
+            latest[source] = i
+    return [
+        item
+        for i, item in enumerate(batch)
+        if not (isinstance(item[2], dict) and item[2].get("type") == "spec_grid" and latest[item[0]] != i)
+    ]
+
+
+class _GridFrameCache:
+    """Remember the last packed ``spec_grid`` frame and the rows it was built from.
+
+    Sessions publish rows straight from the boards' render caches, so the same
+    list objects mean the boards are unchanged and the frame can be reused.
+    """
+
+    __slots__ = ("_rows", "_frame")
+
+    def __init__(self) -> None:
+        self._rows: tuple[Any, Any] | None = None
+        self._frame = b""
+
+    def frame(self, obj: dict) -> bytes:
+        rows = self._rows
+        if rows is None or rows[0] is not obj["rows_p1"] or rows[1] is not obj["rows_p2"]:
+            self._frame = pack(PacketType.GAME, 0, obj)
+            self._rows = (obj["rows_p1"], obj["rows_p2"])
+        return self._frame
+
+
+class SpectatorFanout(threading.Thread):
+    """Single daemon thread that delivers lobby broadcasts off the game thread.
+
+    Producers enqueue ``(source, msg, obj)`` items and return immediately; the
+    fanout thread drains whatever has queued up, skips stale board snapshots
+    and hands the rest to *sink* in order.  *flush*, if given, is called once
+    per drained batch so the sink can buffer its writes and push them out
+    together; a truthy return means some output is still pending, and the
+    flush is retried shortly even if nothing new is queued.  Work that writes
+    to the sink's streams directly goes through :meth:`call_soon`, so only
+    this thread ever touches them.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[str | None, Any | None], None],
+        flush: Callable[[], bool | None] | None = None,
+    ) -> None:
+        super().__init__(daemon=True)
+        self._sink = sink
+        self._flush = flush
+        self._queue: queue.SimpleQueue[tuple[Any, str | None, Any | None]] = queue.SimpleQueue()
+
+    def submit(self, source: Any, msg: str | None, obj: Any | None = None) -> None:
+        """Queue one broadcast; *source* identifies the sender for coalescing."""
+        self._queue.put((source, msg, obj))
+
+    def broadcast_from(
+        self, source: Any, audience: Callable[[], bool] | None = None
+    ) -> Callable[[str | None, Any | None], None]:
+        """Return a ``broadcast(msg, obj)`` callback bound to *source*.
+
+        With *audience*, broadcasts made while it returns False are dropped
+        at the producer instead of being queued for nobody.
+        """
+
+        def broadcast(msg: str | None, obj: Any | None = None) -> None:
+            if audience is None or audience():
+                self.submit(source, msg, obj)
+
+        return broadcast
+
+    def call_soon(self, fn: Callable[[], None]) -> None:
+        """Run *fn* on the fanout thread once everything queued before it is flushed."""
+        self._queue.put((None, None, fn))
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Block until everything submitted so far has been handed to the sink."""
+        done = threading.Event()
+        self.call_soon(done.set)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver what is already queued, then stop the fanout thread."""
+        self._queue.put((None, None, _STOP))
+        if self.is_alive():
+            self.join(timeout)
+
+    def run(self) -> None:
+        pending = False
+        while True:
+            try:
+                batch = [self._queue.get(timeout=_FLUSH_RETRY if pending else None)]
+            except queue.Empty:
+                pending = self._flush_sink()
+                continue
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for _, msg, obj in _coalesce(batch):
+                if obj is _STOP:
+                    self._flush_sink()
+                    return
+                if callable(obj):
+                    # call_soon() item; payloads are never callable
+                    self._flush_sink()
+                    try:
+                        obj()
+                    except Exception:  # noqa: BLE001
+                        logger.exception("Spectator fanout callback failed")
+                    continue
+                try:
+                    self._sink(msg, obj)
+                except Exception:  # noqa: BLE001
+                    logger.exception("Spectator broadcast failed")
+            pending = self._flush_sink()
+
+    def _flush_sink(self) -> bool:
+        if self._flush is None:
+            return False
+        try:
+            return bool(self._flush())
+        except Exception:  # noqa: BLE001
+            logger.exception("Spectator flush failed")
+            return False
 
 
 # Add helper for requeue logic
 def requeue_players(
-    lobby: list[tuple[socket.socket, Optional[str]]],
+    lobby: MutableSequence[tuple[socket.socket, Optional[str]]],
     winner: tuple[socket.socket, Optional[str]],
     loser: tuple[socket.socket, Optional[str]],
     reason: str,
@@ -136,25 +278,180 @@ def main() -> None:  # pragma: no cover – side-effect entrypoint
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
     _parse_cli_flags(sys.argv)
+    sys.setswitchinterval(_cfg.SWITCH_INTERVAL)
 
     logging.info(f"BEER server listening on {HOST}:{PORT}")
-    # lobby holds tuples of (conn, reconnect_token)
-    lobby: list[tuple[socket.socket, Optional[str]]] = []
+    # lobby holds tuples of (conn, reconnect_token); a deque so pairing pops
+    # and winner re-queues at the head are O(1)
+    lobby: deque[tuple[socket.socket, Optional[str]]] = deque()
+    # Serialises lobby mutations across threads; each one republishes
+    # lobby_view, the immutable copy readers iterate without locking
+    lobby_lock = threading.Lock()
+    lobby_view: tuple[tuple[socket.socket, Optional[str]], ...] = ()
+
+    def _lobby_changed() -> None:
+        """Republish lobby_view; call with lobby_lock held after a mutation."""
+        nonlocal lobby_view
+        lobby_view = tuple(lobby)
+
     current_session: GameSession | None = None
     session_ready = threading.Event()
-
-    # Broadcast helper: send to every waiting client in the lobby
+    # One buffered read/write stream per lobby socket: it reads the handshake,
+    # carries every lobby broadcast and is handed to the session on pairing
+    lobby_streams: dict[socket.socket, BufferedRWPair] = {}
+    grid_frames = _GridFrameCache()
+    # Bytes still sitting in each lobby stream (fanout thread only); capped at
+    # the stream's buffer so queuing a frame never blocks on a slow client
+    unflushed: dict[socket.socket, int] = {}
+
+    def _lobby_stream(sock: socket.socket) -> BufferedRWPair:
+        """Open the lobby stream of a client being admitted to the lobby."""
+        stream = lobby_streams.get(sock)
+        if stream is None:
+            stream = lobby_streams[sock] = open_stream(sock, _LOBBY_BUFFER)
+        return stream
+
+    def _release_stream(sock: socket.socket) -> None:
+        """Close the lobby stream of a socket that is leaving the lobby."""
+        stream = lobby_streams.pop(sock, None)
+        if stream is not None:
+            with contextlib.suppress(Exception):
+                stream.close()
+
+    def _lobby_watching() -> bool:
+        return bool(lobby_view)
+
+    def _drop_dead(dead: list[tuple[socket.socket, Optional[str]]]) -> None:
+        # Drop vanished clients after the fan-out, so they are neither retried
+        # on every broadcast nor paired into the next match
+        for entry in dead:
+            try:
+                with lobby_lock:
+                    lobby.remove(entry)
+                    _lobby_changed()
+            except ValueError:
+                continue  # already left the lobby (paired) meanwhile
+            logger.info(f"Lobby update: token {entry[1]!r} disconnected (size={len(lobby)})")
+            # Shut down first so closing the stream cannot block on its backlog
+            with contextlib.suppress(OSError):
+                entry[0].shutdown(socket.SHUT_RDWR)
+            _release_stream(entry[0])
+            with contextlib.suppress(OSError):
+                entry[0].close()
+
+    # Frames packed since the last lobby_flush(), and their total size
+    # (fanout thread only)
+    batch_frames: list[bytes] = []
+    batch_bytes = 0
+
+    # Broadcast helper: pack a frame for every waiting client in the lobby;
+    # lobby_flush() hands each client the whole batch in one write and send
     def lobby_broadcast(msg: str | None, obj: Any | None = None) -> None:
-        for sock, _ in lobby:
+        nonlocal batch_bytes
+        if not lobby_view:
+            return  # nobody waiting: skip packing altogether
+        # Lobby frames all carry seq 0, so every client gets identical bytes:
+        # pack once and write the same frame to each socket
+        if isinstance(obj, dict) and obj.get("type") == "spec_grid":
+            # Late joiners are re-sent the current snapshot; reuse its frame
+            frame = grid_frames.frame(obj)
+        else:
+            # if obj is a chat payload, send as CHAT frame
+            ptype = PacketType.CHAT if obj and isinstance(obj, dict) and obj.get("type") == "chat" else PacketType.GAME
+            frame = pack(ptype, 0, obj if obj is not None else {"msg": msg})
+        if batch_frames and batch_bytes + len(frame) > _LOBBY_BUFFER:
+            # Hand over what fits in one stream buffer first, so no single
+            # batch exceeds the laggard cap of a client that is keeping up
+            lobby_flush()
+        batch_frames.append(frame)
+        batch_bytes += len(frame)
+
+    def _queue_frames(
+        entry: tuple[socket.socket, Optional[str]], data: bytes, dead: list[tuple[socket.socket, Optional[str]]]
+    ) -> None:
+        """Buffer *data* on one lobby client's stream (fanout thread only)."""
+        pending = unflushed.get(entry[0], 0)
+        if pending + len(data) > _LOBBY_BUFFER:
+            # Would not fit in the stream buffer, so write() could block the
+            # fanout thread: treat the laggard as gone
+            dead.append(entry)
+            return
+        try:
+            # Pairing hands a client's stream to its session under the lock;
+            # a stale lobby_view entry whose stream is gone is skipped, never
+            # given a second stream on a socket the session now owns
+            with lobby_lock:
+                stream = lobby_streams.get(entry[0])
+                if stream is None:
+                    return
+                stream.write(data)
+            unflushed[entry[0]] = pending + len(data)
+        except (BrokenPipeError, ConnectionResetError):
+            dead.append(entry)
+        except Exception:
+            pass
+
+    def _queue_batch() -> None:
+        nonlocal batch_bytes
+        blob = batch_frames[0] if len(batch_frames) == 1 else b"".join(batch_frames)
+        batch_frames.clear()
+        batch_bytes = 0
+        # The lobby is mutated by the accept loop and finishing matches while
+        # the fanout thread broadcasts; iterate the published copy, no lock held
+        dead: list[tuple[socket.socket, Optional[str]]] = []
+        for entry in lobby_view:
+            _queue_frames(entry, blob, dead)
+        _drop_dead(dead)
+
+    def _notify_each(notices: list[tuple[tuple[socket.socket, Optional[str]], str]]) -> None:
+        """Queue a private INFO line per lobby client; run via fanout.call_soon()."""
+        dead: list[tuple[socket.socket, Optional[str]]] = []
+        for entry, msg in notices:
+            _queue_frames(entry, pack(PacketType.GAME, 0, {"msg": msg}), dead)
+        _drop_dead(dead)
+
+    def lobby_flush() -> bool:
+        """Flush the streams whose socket can take data now; True if some still wait.
+
+        A slow or half-open spectator keeps its frames buffered until it drains
+        instead of blocking the fanout thread, and with it everyone else.
+        """
+        if batch_frames:
+            _queue_batch()
+        if not unflushed:
+            return False
+        poller = select.poll()
+        by_fd: dict[int, socket.socket] = {}
+        for sock in tuple(unflushed):
+            fd = sock.fileno()
+            if fd < 0:
+                unflushed.pop(sock, None)
+                continue
+            by_fd[fd] = sock
+            poller.register(fd, select.POLLOUT)
+        gone: set[socket.socket] = set()
+        for fd, events in poller.poll(0):
+            sock = by_fd[fd]
+            unflushed.pop(sock, None)
+            if events & (select.POLLERR | select.POLLHUP | select.POLLNVAL):
+                gone.add(sock)
+                continue
+            stream = lobby_streams.get(sock)
+            if stream is None:
+                continue
             try:
-                wfile = sock.makefile("w")
-                # if obj is a chat payload, send as CHAT frame
-                ptype = (
-                    PacketType.CHAT if obj and isinstance(obj, dict) and obj.get("type") == "chat" else PacketType.GAME
-                )
-                io_send(wfile, 0, ptype, msg=msg, obj=obj)
+                stream.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                gone.add(sock)
             except Exception:
                 pass
+        if gone:
+            _drop_dead([entry for entry in lobby_view if entry[0] in gone])
+        return bool(unflushed)
+
+    # Game threads hand spectator traffic to one shared fanout thread
+    fanout = SpectatorFanout(lobby_broadcast, lobby_flush)
+    fanout.start()
 
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_sock:
         server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -174,98 +471,127 @@ def main() -> None:  # pragma: no cover – side-effect entrypoint
 
         def _try_pair_lobby():
             nonlocal current_session, session_ready
-            while len(lobby) >= 2 and (not current_session or not current_session.is_alive()):
-                (c1, token1) = lobby.pop(0)
-                (c2, token2) = lobby.pop(0)
-                # Prevent duplicate tokens in a new match
-                if token1 and token2 and token1 == token2:
-                    logging.warning(f"Duplicate token {token1} in lobby; resetting second slot to fresh token")
-                    token2 = None
-                logging.info("Launching new game session")
-                ships_list = ONE_SHIP_LIST if USE_ONE_SHIP else SHIPS
-                session_ready.clear()
-                # Generate or reuse PID-tokens
-                t1 = token1 or f"PID{next(_pid_counter)}"
-                t2 = token2 or f"PID{next(_pid_counter)}"
-                # Instantiate session (ReconnectController inside will register tokens),
-                # passing in our unified lobby broadcast
-                current_session = GameSession(
-                    c1,
-                    c2,
-                    ships=ships_list,
-                    token_p1=t1,
-                    token_p2=t2,
-                    session_ready=session_ready,
-                    broadcast=lobby_broadcast,
-                )
-
-                # Temporary event router – converts to debug log for now.
-                router = EventRouter(current_session)
-                current_session.subscribe(router)
-
-                # Monitor the match, then re-queue both players (no more "spectators" here)
-                def _monitor_session(sess: GameSession) -> None:
-                    sess.join()
-                    winner = sess.winner or 0
-                    reason = sess.win_reason or ""
-                    # report with PID tokens
-                    winning_tok = sess.token_p1 if winner == 1 else sess.token_p2
-                    losing_tok = sess.token_p2 if winner == 1 else sess.token_p1
-                    # Match completion log in gold
-                    logger.info(f"\033[93mMatch completed – {winning_tok} won by {reason}\033[0m")
-                    # broadcast concession to waiting spectators
-                    if reason == "concession":
-                        lobby_broadcast(f"\033[93mINFO Player {losing_tok} has forfeited – match over\033[0m", None)
-                        logger.info(f"{losing_tok} concedes – match over")
-                    # Notify current spectators of the match result
-                    shots = getattr(sess, "win_shots", None) or 0
-                    winning_tok = sess.token_p1 if winner == 1 else sess.token_p2
-                    losing_tok = sess.token_p2 if winner == 1 else sess.token_p1
-                    result_msg = f"INFO {winning_tok} BEAT {losing_tok} IN {shots} SHOTS"
-                    # Broadcast result to all waiting spectators
-                    lobby_broadcast(f"\033[93m{result_msg}\033[0m", None)
-                    # Log the full lobby queue as a vertical list (entries indented)
-                    tokens = [tok for _, tok in lobby]
-                    queue_str = "\n".join("  " + tok for tok in tokens)
-                    logger.info(f"Lobby queue:\n{queue_str}")
-                    # Notify waiting spectators of their updated queue positions
-                    # (skip positions 1–2, they're about to start the next match)
-                    for pos, (sock, _) in enumerate(lobby, start=1):
-                        if pos <= 2:
-                            continue
-                        try:
-                            wfile = sock.makefile("w")
-                            io_send(wfile, 0, msg=f"\033[93mINFO You are number {pos-2} in the queue to play\033[0m")
-                        except Exception:
-                            pass
-                    # Spectator notification log in green
-                    logger.info(f"\033[32mSpectators notified: {result_msg}\033[0m")
-                    # Re-queue both players back into lobby
-                    if winner == 1:
-                        w_sock, w_tok = sess.p1_sock, sess.token_p1
-                        l_sock, l_tok = sess.p2_sock, sess.token_p2
-                    else:
-                        w_sock, w_tok = sess.p2_sock, sess.token_p2
-                        l_sock, l_tok = sess.p1_sock, sess.token_p1
-                    requeue_players(lobby, (w_sock, w_tok), (l_sock, l_tok), reason)
-                    # kick off next match if ready
-                    _try_pair_lobby()
-
-                current_session.start()
+            while True:
+                # Pairing runs on the accept thread and on finishing matches;
+                # claim the pair and start its session as one step
+                with lobby_lock:
+                    if len(lobby) < 2 or (current_session and current_session.is_alive()):
+                        return
+                    (c1, token1) = lobby.popleft()
+                    (c2, token2) = lobby.popleft()
+                    _lobby_changed()
+                    # Prevent duplicate tokens in a new match
+                    if token1 and token2 and token1 == token2:
+                        logging.warning(f"Duplicate token {token1} in lobby; resetting second slot to fresh token")
+                        token2 = None
+                    logging.info("Launching new game session")
+                    ships_list = ONE_SHIP_LIST if USE_ONE_SHIP else SHIPS
+                    session_ready.clear()
+                    # Generate or reuse PID-tokens
+                    t1 = token1 or f"PID{next(_pid_counter)}"
+                    t2 = token2 or f"PID{next(_pid_counter)}"
+                    # Instantiate session (ReconnectController inside will register tokens),
+                    # passing in our unified lobby broadcast
+                    # The session takes over the lobby streams (and anything
+                    # they buffered) instead of wrapping the sockets again
+                    current_session = GameSession(
+                        c1,
+                        c2,
+                        io_p1=lobby_streams.pop(c1, None),
+                        io_p2=lobby_streams.pop(c2, None),
+                        ships=ships_list,
+                        token_p1=t1,
+                        token_p2=t2,
+                        session_ready=session_ready,
+                        # A match with nobody waiting skips spectator traffic
+                        # and board renders; late joiners catch the next one
+                        broadcast=fanout.broadcast_from((t1, t2), _lobby_watching),
+                        audience=_lobby_watching,
+                    )
+
+                    # Temporary event router – converts to debug log for now.
+                    router = EventRouter(current_session)
+                    current_session.subscribe(router)
+
+                    # Runs on the finishing match thread itself (no watcher thread):
+                    # report the result, then re-queue both players
+                    def _on_session_finished(sess: GameSession) -> None:
+                        nonlocal current_session
+                        if current_session is sess:
+                            current_session = None
+                        winner = sess.winner or 0
+                        reason = sess.win_reason or ""
+                        # report with PID tokens
+                        winning_tok = sess.token_p1 if winner == 1 else sess.token_p2
+                        losing_tok = sess.token_p2 if winner == 1 else sess.token_p1
+                        # Match completion log in gold
+                        logger.info(f"\033[93mMatch completed – {winning_tok} won by {reason}\033[0m")
+                        # broadcast concession to waiting spectators
+                        if reason == "concession":
+                            fanout.submit(None, f"\033[93mINFO Player {losing_tok} has forfeited – match over\033[0m")
+                            logger.info(f"{losing_tok} concedes – match over")
+                        # Notify current spectators of the match result
+                        shots = getattr(sess, "win_shots", None) or 0
+                        winning_tok = sess.token_p1 if winner == 1 else sess.token_p2
+                        losing_tok = sess.token_p2 if winner == 1 else sess.token_p1
+                        result_msg = f"INFO {winning_tok} BEAT {losing_tok} IN {shots} SHOTS"
+                        # Broadcast result to all waiting spectators
+                        fanout.submit(None, f"\033[93m{result_msg}\033[0m")
+                        # Log the full lobby queue as a vertical list (entries indented)
+                        waiting = lobby_view
+                        tokens = [tok for _, tok in waiting]
+                        queue_str = "\n".join("  " + tok for tok in tokens)
+                        logger.info(f"Lobby queue:\n{queue_str}")
+                        # Notify waiting spectators of their updated queue positions
+                        # (skip positions 1–2, they're about to start the next match);
+                        # the fanout thread owns the lobby streams, so it writes them
+                        positions = [
+                            (entry, f"\033[93mINFO You are number {pos-2} in the queue to play\033[0m")
+                            for pos, entry in enumerate(waiting, start=1)
+                            if pos > 2
+                        ]
+                        if positions:
+                            fanout.call_soon(functools.partial(_notify_each, positions))
+                        # Deliver the result before anyone leaves the lobby for the next match
+                        fanout.drain(timeout=5.0)
+                        # Spectator notification log in green
+                        logger.info(f"\033[32mSpectators notified: {result_msg}\033[0m")
+                        # Re-queue both players back into lobby
+                        if winner == 1:
+                            w_sock, w_tok = sess.p1_sock, sess.token_p1
+                            l_sock, l_tok = sess.p2_sock, sess.token_p2
+                        else:
+                            w_sock, w_tok = sess.p2_sock, sess.token_p2
+                            l_sock, l_tok = sess.p1_sock, sess.token_p1
+                        with lobby_lock:
+                            requeue_players(lobby, (w_sock, w_tok), (l_sock, l_tok), reason)
+                            # Re-admitted players get a fresh lobby stream; their
+                            # old one went to the session with them
+                            for sock, _ in lobby:
+                                if sock in (w_sock, l_sock):
+                                    _lobby_stream(sock)
+                            _lobby_changed()
+                        # kick off next match if ready
+                        _try_pair_lobby()
+
+                    current_session.on_finish = _on_session_finished
+                    current_session.start()
                 session_ready.wait()
-                threading.Thread(target=_monitor_session, args=(current_session,), daemon=True).start()
 
         try:
             while True:
                 # Accept new connection (blocking)
                 conn, addr = server_sock.accept()
                 logger.info(f"Connection from {addr}")
+                # Lobby batches already leave in one send; don't let Nagle hold
+                # back the next one behind the client's delayed ACK
+                with contextlib.suppress(OSError):
+                    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 # Framed handshake: read a GAME packet carrying {"token": ...}
                 try:
-                    br = conn.makefile("rb")
-                    bw = conn.makefile("wb")
-                    ptype, seq, obj = recv_pkt(br)
-                    send_pkt(bw, PacketType.ACK, seq, None)
+                    stream = _lobby_stream(conn)
+                    ptype, seq, obj = recv_pkt(stream)
+                    send_pkt(stream, PacketType.ACK, seq, None)
                     token_str = obj.get("token") if isinstance(obj, dict) else None
                 except Exception:
                     token_str = None
@@ -275,6 +601,8 @@ def main() -> None:  # pragma: no cover – side-effect entrypoint
                     ctrl = PID_REGISTRY.get(token_str)
                     # only attempt reattach if we found a controller
                     if ctrl:
+                        # The session builds its own streams for a rebound socket
+                        _release_stream(conn)
                         if ctrl.attach_player(token_str, conn):
                             # Reattachment log in red
                             logger.info(f"\033[91mReattached via PID-token {token_str}\033[0m")
@@ -282,26 +610,36 @@ def main() -> None:  # pragma: no cover – side-effect entrypoint
                             continue
 
                 # Always treat fresh connections as waiting/spectating clients
-                lobby.append((conn, token_str))
-                # New spectator waiting in lobby
-                pos = len(lobby)
+                with lobby_lock:
+                    lobby.append((conn, token_str))
+                    _lobby_changed()
+                    # New spectator waiting in lobby
+                    pos = len(lobby)
                 logger.info(f"Lobby update: token {token_str!r} joined (size={pos})")
 
                 # if a game is already in progress, inform the new client:
                 if current_session and current_session.is_alive():
-                    wfile = conn.makefile("w")
-                    # Notify spectator status
-                    io_send(wfile, 0, msg="\033[93mINFO You are now spectating\033[0m")
-                    # Notify queue position
-                    io_send(wfile, 0, msg=f"\033[93mINFO You are currently number {pos} in the queue to play\033[0m")
-                    # Optionally ship them the current board immediately
-                    rows_p1 = grid_rows(current_session.board_p1, reveal=True)
-                    rows_p2 = grid_rows(current_session.board_p2, reveal=True)
-                    lobby_broadcast(None, {"type": "spec_grid", "rows_p1": rows_p1, "rows_p2": rows_p2})
+                    # Spectator status and queue position, written by the fanout
+                    # thread like every other lobby frame
+                    entry = (conn, token_str)
+                    fanout.call_soon(
+                        functools.partial(
+                            _notify_each,
+                            [
+                                (entry, "\033[93mINFO You are now spectating\033[0m"),
+                                (entry, f"\033[93mINFO You are currently number {pos} in the queue to play\033[0m"),
+                            ],
+                        )
+                    )
+                    # Ship them the current boards; nothing was published while
+                    # nobody watched, so the session renders them on demand
+                    rows_p1, rows_p2 = current_session.spec_view()
+                    fanout.submit(None, None, {"type": "spec_grid", "rows_p1": rows_p1, "rows_p2": rows_p2})
 
                 _try_pair_lobby()
         finally:
-            for sock, _ in lobby:
+            fanout.close(timeout=1.0)
+            for sock, _ in lobby_view:
                 with contextlib.suppress(Exception):
                     sock.shutdown(socket.SHUT_RDWR)
                 sock.close()
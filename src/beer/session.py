@@ -14,6 +14,10 @@ Server → Client messages
 START <you|opp>          Sent at the beginning, tells the client whether it goes first.
 GRID                    Followed by 11 lines (header + 10 rows) representing *your* current
                         view of the opponent's board.  Ends with a blank line.
+INIT_STATE              Framed ``type=init_state`` snapshot sent at match start and on
+                        reconnect: your fleet plus the opponent's hidden and fog views.
+CELL                    Framed ``type=cell`` delta sent after each shot instead of
+                        full grids: one cell of your own or opponent view changed.
 HIT <coord>             Your shot was a hit (and potentially sinks later).
 MISS <coord>            Your shot missed.
 SUNK <ship>             You have just sunk the named ship.
@@ -34,33 +38,90 @@ existing reference `client.py` continues to work.
 from __future__ import annotations
 
 import contextlib
-import re
 import socket
 import threading
 import time
 import select
-from typing import TextIO, Any, Callable, List
+from io import BufferedRWPair
+from typing import Any, Callable
 import logging
 
-from .battleship import Board, SHIPS, parse_coordinate, SHIP_LETTERS
-from .common import PacketType, unpack, handle_control_frame
+from .battleship import Board, SHIPS
+from .common import PacketType, IncompleteError, unpack, handle_control_frame
 from .io_utils import (
     send as io_send,
-    send_grid,
-    send_opp_grid,
+    send_cell,
+    send_init_state,
     chat_broadcast,
-    recv_cmd,
-    refresh_views,
     grid_rows,
+    open_stream,
 )
 from .commands import parse_command, ChatCommand, FireCommand, QuitCommand, CommandParseError
-from .reconnect_controller import ReconnectController
-from .placement_wizard import run as place_ships
+from .reconnect_controller import ReconnectController, PID_REGISTRY
 from . import config as _cfg
 from .events import Event, Category
-from .coord_utils import coord_to_rowcol, format_coord, COORD_RE
+from .coord_utils import format_coord
 
 SHOT_CLOCK = _cfg.TIMEOUT  # seconds for both turn and reconnect wait
+_IO_BUFFER = 65536  # per-slot read/write buffer size in bytes
+_SNDBUF = 128 * 1024  # kernel send buffer per player socket, in bytes
+# epoll interest set for player sockets (Linux); RDHUP reports a peer FIN
+_HUP_MASK = getattr(select, "EPOLLHUP", 0) | getattr(select, "EPOLLRDHUP", 0) | getattr(select, "EPOLLERR", 0)
+_POLL_MASK = getattr(select, "EPOLLIN", 0) | _HUP_MASK
+
+# Invariant parts of the gold-coloured match-start messages
+_RESET = "\033[0m"
+_NEW_GAME_P1 = "\033[93mINFO New game: you are Player 1" + _RESET
+_NEW_GAME_P2 = "\033[93mINFO New game: you are Player 2" + _RESET
+_MATCH_VS = "\033[93mINFO You are now playing a new match against "
+_START_YOU = "\033[93mSTART you "
+_START_OPP = "\033[93mSTART opp "
+
+# %-templates for per-shot and end-of-match lines
+_WIN_FMT = "YOU HAVE WON WITH %d SHOTS"
+_LOSE_FMT = "YOU HAVE LOST – opponent won with %d shots"
+_SUNK_FMT = "\033[91mSUNK %s" + _RESET
+_YOU_FMT = {"hit": "YOU HIT at %s", "miss": "YOU MISSED at %s"}
+_OPP_FMT = {"hit": "OPPONENT HIT at %s", "miss": "OPPONENT MISSED at %s"}
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    """Apply keepalive and no-delay options to a player socket where supported."""
+    # Enable TCP keepalive to detect disconnects promptly
+    with contextlib.suppress(OSError):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Frames are batched by the session, so ship each flush immediately
+    with contextlib.suppress(OSError):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    # Room for a whole batched burst without blocking in send()
+    with contextlib.suppress(OSError):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SNDBUF)
+    # Linux-only: ACK the client's commands without delay, and give up on a
+    # peer that leaves data unacknowledged for longer than the shot clock
+    if hasattr(socket, "TCP_QUICKACK"):
+        with contextlib.suppress(OSError):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    if hasattr(socket, "TCP_USER_TIMEOUT"):
+        with contextlib.suppress(OSError):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, int(SHOT_CLOCK * 1000))
+
+
+def _has_buffered(sock: socket.socket, stream: BufferedRWPair) -> bool:
+    """Return True if *stream* holds unread bytes, without blocking.
+
+    Frames a client pipelines arrive in one recv and land in the stream's read
+    buffer together; the poller only sees the socket, so it never reports the
+    ones left behind after the first is unpacked.
+    """
+    timeout = sock.gettimeout()
+    try:
+        sock.settimeout(0)
+        return bool(stream.peek(1))
+    except (OSError, ValueError):
+        return False
+    finally:
+        with contextlib.suppress(OSError):
+            sock.settimeout(timeout)
 
 
 class GameSession(threading.Thread):
@@ -73,30 +134,52 @@ class GameSession(threading.Thread):
         *,
         token_p1: str,
         token_p2: str,
+        io_p1: BufferedRWPair | None = None,
+        io_p2: BufferedRWPair | None = None,
         ships=None,
         session_ready=None,
         broadcast: Callable[[str | None, Any | None], None],
+        audience: Callable[[], bool] | None = None,
     ):
         """Create a thread that manages a full two-player match.
 
         Args:
             p1/p2: Already-accepted TCP sockets for player 1 and 2. The
-                constructor converts them to text I/O wrappers and prepares
+                constructor wraps each in a binary buffered stream and prepares
                 per-player boards, reconnect tokens, and spectator tracking.
+            io_p1/io_p2: Existing ``makefile("rwb")`` streams for p1/p2 to
+                adopt instead, e.g. the server's lobby streams, so frames
+                they already buffered are not lost.
+            audience: Optional predicate telling whether anyone is watching;
+                while it returns False the spectator board is not rendered.
         """
         super().__init__(daemon=True)
-        self.p1_sock = p1
-        self.p2_sock = p2
-        # Enable TCP keepalive to detect disconnects promptly
-        try:
-            self.p1_sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-            self.p2_sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-        except Exception:
-            pass  # Not all platforms support this, but try
-        self.p1_file_r: TextIO = p1.makefile("r")
-        self.p1_file_w: TextIO = p1.makefile("w")
-        self.p2_file_r: TextIO = p2.makefile("r")
-        self.p2_file_w: TextIO = p2.makefile("w")
+        _tune_socket(p1)
+        _tune_socket(p2)
+        # Kernel-side readiness + hang-up notification for both player sockets;
+        # plain select() is used where epoll is unavailable.
+        self._poller = select.epoll() if hasattr(select, "epoll") else None
+        self._polled: dict[int, socket.socket] = {}
+        # Sockets whose stream may still buffer a frame after the last unpack
+        self._recheck: set[socket.socket] = set()
+        self._watch(p1)
+        self._watch(p2)
+        # Self-pipe the reconnect path writes to, so a reattach wakes a turn
+        # that is blocked waiting on the old, possibly silent, socket
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._watch(self._wake_r)
+        # Each slot's socket and its buffered binary stream, used for both
+        # reading and writing frames, keyed by player number (1 or 2) so
+        # per-turn code never branches on the slot; _rebind_slot swaps them
+        self._socks: dict[int, socket.socket] = {1: p1, 2: p2}
+        self._ios: dict[int, BufferedRWPair] = {
+            1: io_p1 if io_p1 is not None else open_stream(p1, _IO_BUFFER),
+            2: io_p2 if io_p2 is not None else open_stream(p2, _IO_BUFFER),
+        }
+        # An adopted stream may already hold frames read ahead of the handshake
+        self._recheck.update(sock for sock, io in ((p1, io_p1), (p2, io_p2)) if io is not None)
         # Ship roster for this match
         self.ships = ships if ships is not None else SHIPS
         self.session_ready = session_ready
@@ -104,100 +187,156 @@ class GameSession(threading.Thread):
         # Each player gets their *own* hidden board.
         self.board_p1 = Board()
         self.board_p2 = Board()
+        self._boards: dict[int, Board] = {1: self.board_p1, 2: self.board_p2}
         # Spectator streams now managed via SpectatorHub
         # Every *half-turn* (i.e. after each individual shot) we increment
         # this counter; spectators receive a full dual-board update after
         # every *two* shots (both players have acted).
         self._half_turn_counter: int = 0
+        # Latest (rows_p1, rows_p2) full-reveal snapshot, replaced wholesale
+        # by the game thread and read lock-free by the server's spectator path
+        self.spec_snapshot: tuple[list[str], list[str]] | None = None
+        # Guards the one-way _concluded flag so a match ends exactly once
         self._lock = threading.Lock()
+        self._concluded = False
         self._seq = 0
 
         # Reconnect support (Tier 3) using PID tokens
         self.token_p1 = token_p1
         self.token_p2 = token_p2
+        self._tokens: dict[int, str] = {1: token_p1, 2: token_p2}
         # Modular I/O sequencing and helpers
         self.io_seq = 0
 
-        # Unified send callback for writing to a TextIO
-        def _notify(wfile: TextIO, msg: str | None = None, obj: Any | None = None) -> None:
-            # Send a GAME packet with text or obj payload
-            io_send(wfile, self.io_seq, msg=msg, obj=obj)
-            self.io_seq += 1
-
-        self._notify = _notify
-        # Convenience for reconnect notifications to player slots
-        self._notify_player = lambda slot, txt: self._notify(self.p1_file_w if slot == 1 else self.p2_file_w, txt)
         # Broadcast callback for all waiting clients
         self._broadcast = broadcast
+        self._audience = audience
 
         # Initialize reconnect controller (registers both tokens)
-        from .server import PID_REGISTRY
-
         self.recon = ReconnectController(
             SHOT_CLOCK,
             self._notify_player,
             self.token_p1,
             self.token_p2,
             PID_REGISTRY,
+            on_attach=self._wake,
         )
 
         # Out-of-thread result reporting
         self.winner: int | None = None
         self.win_reason: str | None = None
+        # Called with this session as the last thing run() does, on the match
+        # thread, so the server needs no separate thread to join() on it
+        self.on_finish: Callable[["GameSession"], None] | None = None
 
         # Shot counters per player
         self._shots: dict[int, int] = {1: 0, 2: 0}
-        # Track fired coords to prevent duplicate shots
-        self._fired: dict[int, set[tuple[int, int]]] = {1: set(), 2: set()}
+        # Track fired coords to prevent duplicate shots: bit (row * size + col)
+        # is set once a player has fired at that cell
+        self._fired_mask: dict[int, int] = {1: 0, 2: 0}
 
-        # Event subscribers
-        self._subs: List[Callable[[Event], None]] = []
+        # Event subscribers: an immutable tuple replaced wholesale by
+        # subscribe(), so _emit iterates it without copying or locking
+        self._subs: tuple[Callable[[Event], None], ...] = ()
 
         # Added for the new run method
         self._line_buffer: dict[int, str] = {}
         # Keeps track of whose turn it is (1 or 2); set properly in run()
         self.current: int | None = None
+        # Monotonic time by which the current attacker must act; set on prompt
+        self._turn_deadline: float = 0.0
+
+    # Read-only views of the current slot sockets and streams
+    @property
+    def p1_sock(self) -> socket.socket:
+        return self._socks[1]
+
+    @property
+    def p2_sock(self) -> socket.socket:
+        return self._socks[2]
+
+    @property
+    def p1_io(self) -> BufferedRWPair:
+        return self._ios[1]
+
+    @property
+    def p2_io(self) -> BufferedRWPair:
+        return self._ios[2]
 
     # -------------------- helpers --------------------
-    # Removed duplicate _send and _send_grid methods; using io_utils.send and send_grid directly
+    def _notify(
+        self, wfile: BufferedRWPair, msg: str | None = None, obj: Any | None = None, *, flush: bool = True
+    ) -> None:
+        """Send a GAME packet with text or obj payload and advance io_seq."""
+        io_send(wfile, self.io_seq, msg=msg, obj=obj, flush=flush)
+        self.io_seq += 1
+
+    def _notify_player(self, slot: int, txt: str) -> None:
+        """Send *txt* to whichever stream currently backs player *slot*."""
+        self._notify(self._ios[slot], txt)
+
+    def _publish_spec_grid(self) -> None:
+        """Swap in a fresh dual-board snapshot and queue it for spectators."""
+        if self._audience is not None and not self._audience():
+            # Nobody to show it to: skip the render; a spectator arriving
+            # later gets the next publish instead of a stale board
+            self.spec_snapshot = None
+            return
+        snap = (grid_rows(self.board_p1, reveal=True), grid_rows(self.board_p2, reveal=True))
+        prev = self.spec_snapshot
+        if prev is not None and prev[0] is snap[0] and prev[1] is snap[1]:
+            # Both rows come straight from the boards' render caches, so
+            # identity means neither board changed since the last publish
+            return
+        # Single writer; readers on other threads just load the attribute
+        self.spec_snapshot = snap
+        self._broadcast(None, {"type": "spec_grid", "rows_p1": snap[0], "rows_p2": snap[1]})
+
+    def spec_view(self) -> tuple[list[str], list[str]]:
+        """Return full-reveal rows of both boards for a spectator joining mid-match.
+
+        Safe to call off the match thread: reuses the published snapshot, or
+        renders without touching the boards' render caches when nobody was
+        watching (only the match thread fills those).
+        """
+        snap = self.spec_snapshot
+        if snap is not None:
+            return snap
+        return (
+            [" ".join(row) for row in self.board_p1.hidden_grid],
+            [" ".join(row) for row in self.board_p2.hidden_grid],
+        )
+
+    # Removed duplicate _send and _send_grid methods; using io_utils.send and send_cell directly
 
     # ------------------- match handshake helper -------------------
     def _begin_match(self) -> None:
         """Handshake to start or restart a match: START, placement, initial grids, signal ready."""
         # Emit start event and notify both players
-        self._emit(Event(Category.TURN, "start", {"token_p1": self.token_p1, "token_p2": self.token_p2}))
+        self._emit(Category.TURN, "start", {"token_p1": self.token_p1, "token_p2": self.token_p2})
         # Notify players of new match and tokens (display in gold)
-        self._notify(self.p1_file_w, "\033[93mINFO New game: you are Player 1\033[0m")
-        self._notify(self.p2_file_w, "\033[93mINFO New game: you are Player 2\033[0m")
+        self._notify(self.p1_io, _NEW_GAME_P1, flush=False)
+        self._notify(self.p2_io, _NEW_GAME_P2, flush=False)
         # Inform both players of their opponent's PID-token (display in gold)
-        self._notify(self.p1_file_w, f"\033[93mINFO You are now playing a new match against {self.token_p2}\033[0m")
-        self._notify(self.p2_file_w, f"\033[93mINFO You are now playing a new match against {self.token_p1}\033[0m")
+        self._notify(self.p1_io, _MATCH_VS + self.token_p2 + _RESET, flush=False)
+        self._notify(self.p2_io, _MATCH_VS + self.token_p1 + _RESET, flush=False)
 
         # Legacy START frames for compatibility (display in gold)
-        self._notify(self.p1_file_w, f"\033[93mSTART you {self.token_p1}\033[0m")
-        self._notify(self.p2_file_w, f"\033[93mSTART opp {self.token_p2}\033[0m")
+        self._notify(self.p1_io, _START_YOU + self.token_p1 + _RESET, flush=False)
+        self._notify(self.p2_io, _START_OPP + self.token_p2 + _RESET, flush=False)
 
         # Skip manual placement: randomly place ships for both players
         self.board_p1.place_ships_randomly()
         self.board_p2.place_ships_randomly()
 
-        # Initial own-fleet reveal and opponent views for both players
-        ok1, ok2, self.io_seq = refresh_views(
-            self.p1_file_w,
-            self.p2_file_w,
-            self.io_seq,
-            self.board_p1,
-            self.board_p2,
-        )
-        # Reveal opponent hidden grid for cheat clients
-        send_opp_grid(self.p1_file_w, self.io_seq, self.board_p2)
-        self.io_seq += 1
-        send_opp_grid(self.p2_file_w, self.io_seq, self.board_p1)
-        self.io_seq += 1
+        # Own-fleet reveal plus both opponent views, one frame per player
+        send_init_state(self.p1_io, self.io_seq, self.board_p1, self.board_p2, flush=False)
+        send_init_state(self.p2_io, self.io_seq + 1, self.board_p2, self.board_p1, flush=False)
+        self.io_seq += 2
+        # Ship everything above as one burst per player
+        self._flush_streams()
         # Snapshot for any waiting clients
-        rows_p1 = grid_rows(self.board_p1, reveal=True)
-        rows_p2 = grid_rows(self.board_p2, reveal=True)
-        self._broadcast(None, {"type": "spec_grid", "rows_p1": rows_p1, "rows_p2": rows_p2})
+        self._publish_spec_grid()
 
         # Signal ready for spectators
         if self.session_ready:
@@ -214,8 +353,8 @@ class GameSession(threading.Thread):
 
             while True:
                 # 2) Prompt attacker
-                self._prompt_current_player()
-                self._emit(Event(Category.TURN, "prompt", {"player": current_player}))
+                self._prompt_current_player(restart_clock=True)
+                self._emit(Category.TURN, "prompt", {"player": current_player})
 
                 # 3) Block until we get exactly one Chat/Quit/Fire from either side
                 cmd = self._await_command(current_player)
@@ -225,7 +364,7 @@ class GameSession(threading.Thread):
 
                 # 4) Attacker quit → concession
                 if isinstance(cmd, QuitCommand):
-                    logging.info(f"Player {current_player} conceded – ending match")
+                    logging.info("Player %s conceded – ending match", current_player)
                     self.drop_and_deregister(current_player, reason="concession")
                     return
 
@@ -235,42 +374,116 @@ class GameSession(threading.Thread):
                 self._execute_shot(current_player, row, col)
 
                 # 6) Victory?
-                defender_board = self.board_p2 if current_player == 1 else self.board_p1
+                defender_board = self._boards[3 - current_player]
                 if defender_board.all_ships_sunk():
                     self._conclude(current_player, reason="fleet destroyed")
                     return
 
                 # 7) Swap turns
-                current_player = 2 if current_player == 1 else 1
+                current_player = 3 - current_player
                 self.current = current_player
         finally:
-            # One last board snapshot for any waiting clients
-            rows_p1 = grid_rows(self.board_p1, reveal=True)
-            rows_p2 = grid_rows(self.board_p2, reveal=True)
-            self._broadcast(None, {"type": "spec_grid", "rows_p1": rows_p1, "rows_p2": rows_p2})
+            # _conclude already queued the final boards; cover any other exit
+            if not self._concluded:
+                self._publish_spec_grid()
             # Cleanup reconnect tokens
-            from .server import PID_REGISTRY
-
             PID_REGISTRY.pop(self.recon.token1, None)
             PID_REGISTRY.pop(self.recon.token2, None)
+            self.close()
+            if self.on_finish is not None:
+                try:
+                    self.on_finish(self)
+                except Exception:
+                    logging.exception("on_finish callback failed")
+
+    def close(self) -> None:
+        """Release the poller and wake-up socketpair; player sockets are left alone.
+
+        run() calls this on exit, so only a session that is never started
+        needs closing by its owner.  Safe to call more than once.
+        """
+        if self._poller is not None:
+            self._poller.close()
+        self._wake_r.close()
+        self._wake_w.close()
 
     # -------------------- internal utilities --------------------
+    def _watch(self, sock: socket.socket) -> None:
+        """Register *sock* with the session poller for input and peer hang-up."""
+        if self._poller is None:
+            return
+        fd = sock.fileno()
+        try:
+            self._poller.register(fd, _POLL_MASK)
+        except FileExistsError:
+            # fd number recycled from a socket we never unregistered
+            self._poller.modify(fd, _POLL_MASK)
+        self._polled[fd] = sock
+
+    def _unwatch(self, sock: socket.socket) -> None:
+        """Stop polling *sock* (a no-op if it was never registered)."""
+        if self._poller is None:
+            return
+        for fd, polled in list(self._polled.items()):
+            if polled is sock:
+                del self._polled[fd]
+                with contextlib.suppress(OSError, ValueError):
+                    self._poller.unregister(fd)
+
+    def _wake(self, slot: int) -> None:
+        """Interrupt a pending _wait_readable (called from the accept thread)."""
+        with contextlib.suppress(OSError):
+            self._wake_w.send(b"\0")
+
+    def _wait_readable(self, socks: tuple[socket.socket, ...], timeout: float) -> list[tuple[socket.socket, bool]]:
+        """Wait up to *timeout* seconds for input on *socks*.
+
+        Returns ``(sock, hung_up)`` pairs; *hung_up* is True when the kernel
+        reported the peer gone and there is nothing left to read, so the
+        caller can treat it as a disconnect without touching the socket.
+        An empty list before the deadline means a reconnect woke the wait.
+        """
+        wake = self._wake_r
+        if self._poller is None:
+            readable = select.select([*socks, wake], [], [], timeout)[0]
+            if wake in readable:
+                with contextlib.suppress(OSError):
+                    wake.recv(64)
+            return [(s, False) for s in readable if s is not wake]
+        ready: list[tuple[socket.socket, bool]] = []
+        for fd, mask in self._poller.poll(timeout):
+            sock = self._polled.get(fd)
+            if sock is wake:
+                with contextlib.suppress(OSError):
+                    wake.recv(64)
+            elif sock is not None and sock in socks:
+                ready.append((sock, bool(mask & _HUP_MASK) and not mask & select.EPOLLIN))
+        return ready
+
     def _rebind_slot(self, slot: int, sock: socket.socket) -> None:
         """Rebind player slot to a new socket after reconnect."""
-        if slot == 1:
-            self.p1_sock = sock
-            self.p1_file_r = sock.makefile("r")
-            self.p1_file_w = sock.makefile("w")
-        else:
-            self.p2_sock = sock
-            self.p2_file_r = sock.makefile("r")
-            self.p2_file_w = sock.makefile("w")
-
-        # After rebinding, push the current boards to the re-attached player.
+        _tune_socket(sock)
+        old_sock, old = self._socks[slot], self._ios[slot]
+        self._socks[slot], self._ios[slot] = sock, open_stream(sock, _IO_BUFFER)
+        self._unwatch(old_sock)
+        self._recheck.discard(old_sock)
+        self._watch(sock)
+        # Drop the dead connection's buffers (flushing into it may fail) and
+        # its socket, so repeated reconnects don't pile up open descriptors
+        with contextlib.suppress(Exception):
+            old.close()
+        if old_sock is not sock:
+            with contextlib.suppress(OSError):
+                old_sock.close()
+
+        # Acknowledge the rejoin on the new stream, then push the current
+        # boards to the re-attached player.
+        self._notify_player(3 - slot, "INFO Opponent has reconnected – resuming match")
+        self._notify_player(slot, "INFO You have reconnected – resuming match")
         self._sync_state(slot)
         # If it's their turn now, immediately re-prompt them to fire
         if slot == self.current:
-            self._prompt_current_player()
+            self._prompt_current_player(restart_clock=True)
 
     # ------------------------------------------------------------
     # helper: push fresh boards to a just-reconnected player
@@ -279,36 +492,12 @@ class GameSession(threading.Thread):
         """
         Send up-to-date board state to a re-attaching client.
 
-        • first – their own fleet reveal
-        • second – opponent hidden grid (for cheats to re-seed)
-        • third – opponent fog-of-war view
+        One ``init_state`` frame carries their own fleet reveal, the opponent
+        hidden grid (for cheats to re-seed) and the opponent fog-of-war view.
         """
-        from .io_utils import send_grid, send_opp_grid  # ensure send_opp_grid is imported
-
-        writer = self.p1_file_w if slot == 1 else self.p2_file_w
-        own = self.board_p1 if slot == 1 else self.board_p2
-        opp = self.board_p2 if slot == 1 else self.board_p1
-
-        # 1) your own ships
-        send_grid(writer, self.io_seq, own, reveal=True)
-        self.io_seq += 1
-
-        # 2) hidden opponent map for cheat clients
-        send_opp_grid(writer, self.io_seq, opp)
-        self.io_seq += 1
-
-        # 3) fog-of-war view of opponent
-        send_grid(writer, self.io_seq, opp, reveal=False)
+        send_init_state(self._ios[slot], self.io_seq, self._boards[slot], self._boards[3 - slot])
         self.io_seq += 1
 
-    def _select_players(self, current: int):
-        if current == 1:
-            return self.p1_file_r, self.p1_file_w, self.board_p2, "Player 2"
-        return self.p2_file_r, self.p2_file_w, self.board_p1, "Player 1"
-
-    def _file_pair(self, player_idx: int):
-        return (self.p1_file_r, self.p1_file_w) if player_idx == 1 else (self.p2_file_r, self.p2_file_w)
-
     def _rebind_if_needed(self, slot: int) -> bool:
         """If a new socket has arrived for slot, swap to it and return True."""
         ok, sock = self.recon.try_rebind(slot)
@@ -317,38 +506,55 @@ class GameSession(threading.Thread):
         return ok
 
     def _conclude(self, winner: int, *, reason: str) -> None:
-        logging.debug(f"_conclude: winner={winner}, reason={reason}")
-        loser = 2 if winner == 1 else 1
-        win_w = self.p1_file_w if winner == 1 else self.p2_file_w
-        lose_w = self.p2_file_w if winner == 1 else self.p1_file_w
+        # Only the first terminal path (win, concession, timeout, abandon) reports
+        with self._lock:
+            if self._concluded:
+                return
+            self._concluded = True
+        logging.debug("_conclude: winner=%s, reason=%s", winner, reason)
+        loser = 3 - winner
+        win_w = self._ios[winner]
+        lose_w = self._ios[loser]
         shots = self._shots.get(winner, 0)
-        self._notify(win_w, f"YOU HAVE WON WITH {shots} SHOTS")
-        self._notify(lose_w, f"YOU HAVE LOST – opponent won with {shots} shots")
+        self._notify(win_w, _WIN_FMT % shots, flush=False)
+        self._notify(lose_w, _LOSE_FMT % shots, flush=False)
         # If this was a concession, explicitly notify winner of opponent's forfeiture
         if reason == "concession":
-            self._notify(win_w, "INFO Opponent has forfeited – match over")
+            self._notify(win_w, "INFO Opponent has forfeited – match over", flush=False)
+        self._flush_streams()
 
         # Record result for server logs
         self.winner = winner
         self.win_reason = reason
         self.win_shots = shots  # type: ignore[attr-defined]
+        # Queue the final boards for waiting clients as soon as the result is
+        # known, ahead of the end event and the server's result broadcast
+        self._publish_spec_grid()
         # Emit end-of-game event (EventRouter will broadcast exactly one end-frame per client)
-        self._emit(Event(Category.TURN, "end", {"winner": winner, "reason": reason, "shots": shots}))
+        self._emit(Category.TURN, "end", {"winner": winner, "reason": reason, "shots": shots})
 
     # Spectator operations delegated to SpectatorHub
 
     # -------------------- event bus --------------------
     def subscribe(self, cb: Callable[[Event], None]) -> None:
-        """Allow external components (server/logger) to receive game events."""
-        self._subs.append(cb)
+        """Allow external components (server/logger) to receive game events.
+
+        Not safe to call concurrently with itself; subscribe before start().
+        """
+        self._subs = self._subs + (cb,)
 
-    def _emit(self, ev: Event) -> None:
-        for cb in tuple(self._subs):
+    def _emit(self, category: Category, kind: str, payload: dict[str, Any]) -> None:
+        """Deliver an event to every subscriber; no Event is built if there are none."""
+        subs = self._subs
+        if not subs:
+            return
+        ev = Event(category, kind, payload)
+        for cb in subs:
             try:
                 cb(ev)
             except Exception:
                 # Don't let a misbehaving subscriber kill the game thread
-                pass
+                logging.exception("Event subscriber %r failed on %s", cb, ev.type)
 
     # Add helper for handling simultaneous disconnects
     def _handle_disconnects(self, dropped_slots: list[int]) -> bool:
@@ -362,13 +568,12 @@ class GameSession(threading.Thread):
         """
         for idx in dropped_slots:
             # Log disconnections in red
-            logging.info(f"\033[91mPlayer {idx} disconnected – awaiting reconnect\033[0m")
+            logging.info("\033[91mPlayer %s disconnected – awaiting reconnect\033[0m", idx)
         failed: list[int] = []
         for idx in dropped_slots:
             if self.recon.wait(idx):
                 # Log reconnections in red
-                logging.info(f"\033[91mPlayer {idx} reconnected – resuming match\033[0m")
-                # pull the socket *after* wait() so INFO messages were sent
+                logging.info("\033[91mPlayer %s reconnected – resuming match\033[0m", idx)
                 new_sock = self.recon.take_new_socket(idx)
                 self._rebind_slot(idx, new_sock)
                 continue
@@ -386,16 +591,15 @@ class GameSession(threading.Thread):
 
     def drop_and_deregister(self, slot: int, reason: str) -> None:
         """
-        Close the given player's socket, unregister tokens, and conclude the match.
+        Conclude the match against *slot* and close that player's socket.
+
+        Reconnect tokens are unregistered once, when run() exits.
         """
         # Pick the loser's socket
-        if slot == 1:
-            sock = self.p1_sock
-        else:
-            sock = self.p2_sock
+        sock = self._socks[slot]
 
         # 1) Conclude the match while sockets are still open
-        winner = 2 if slot == 1 else 1
+        winner = 3 - slot
         self._conclude(winner, reason=reason)
 
         # 2) Now shut down and close only the loser's socket
@@ -405,41 +609,26 @@ class GameSession(threading.Thread):
             pass
         sock.close()
 
-        # 3) Unregister reconnect tokens
-        from .server import PID_REGISTRY
-
-        PID_REGISTRY.pop(self.token_p1, None)
-        PID_REGISTRY.pop(self.token_p2, None)
-
-    # -----
-    # Reconnect helpers (installed by cursor-fix-reconnect)
-    # -----
-    def _is_eof(self, sock: socket.socket) -> bool:
-        """
-        Return True only when the peer has really closed the TCP stream.
-        Uses MSG_PEEK so no user data is consumed.
-        """
-        try:
-            data = sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT)
-            return len(data) == 0
-        except BlockingIOError:
-            return False
-        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
-            return True
-
-    def _prompt_current_player(self) -> None:
+    def _prompt_current_player(self, *, restart_clock: bool = False) -> None:
         """
         Send the canonical 'Your turn' frame to whichever slot is stored in self.current.
+
+        With *restart_clock* the attacker also gets a fresh shot clock: at the
+        start of a turn and after a reconnect, but not on re-prompts after
+        chat or a rejected command, which must not extend the turn.
         """
-        w = self.p1_file_w if self.current == 1 else self.p2_file_w
+        if self.current is None:
+            return  # match not started yet
+        # Start the clock before the prompt leaves, so it is set by the time
+        # the attacker can react
+        if restart_clock:
+            self._turn_deadline = time.monotonic() + SHOT_CLOCK
         # Display turn prompts in gold
-        self._notify(w, "INFO YOUR TURN – FIRE <coord> or QUIT")
+        self._notify(self._ios[self.current], "INFO YOUR TURN – FIRE <coord> or QUIT")
 
     # ------------------------------------------------------------
     def _control_loop(self, ctrl_reader, data_writer_buf):  # binary reader, BufferedWriter
         """Loop reading ACK/NAK control frames and invoke retransmit/prune."""
-        from .common import PacketType
-
         while True:
             try:
                 ptype, seq, obj = unpack(ctrl_reader)
@@ -453,43 +642,76 @@ class GameSession(threading.Thread):
         Wait for exactly one of:
           - FireCommand from the attacker (returns FireCommand)
           - QuitCommand from the attacker (returns QuitCommand)
-          - Defender QuitCommand or attacker reconnect timeout (returns None)
+          - Defender QuitCommand, attacker reconnect timeout, or the attacker
+            letting the shot clock run out (returns None)
         In the meantime, handles:
           • out-of-turn ChatCommand → broadcasts and re-prompts
           • duplicate shots → ERR + re-prompt
           • out-of-turn FireCommand → ERR + re-prompt
           • unexpected disconnect on attacker → _handle_disconnects
         """
-        import select
+        # Loop-invariant lookups bound once; sockets/streams are re-read each
+        # pass because a reconnect replaces them.
+        monotonic = time.monotonic
+        wait_readable = self._wait_readable
+        fired = self._fired_mask
+        size = self.board_p1.size
+        recheck = self._recheck
+        socks, ios = self._socks, self._ios
+        def_slot = 3 - attacker_idx
 
         while True:
             # 1) If attacker reconnected, rebind & sync (sends INFO messages)
             self._rebind_if_needed(attacker_idx)
 
-            # 2) Grab current sockets, buffers, writers
-            if attacker_idx == 1:
-                att_sock, att_buf, att_w = self.p1_sock, self.p1_file_r.buffer, self.p1_file_w
-                def_sock, def_buf, def_w, def_slot = self.p2_sock, self.p2_file_r.buffer, self.p2_file_w, 2
-            else:
-                att_sock, att_buf, att_w = self.p2_sock, self.p2_file_r.buffer, self.p2_file_w
-                def_sock, def_buf, def_w, def_slot = self.p1_sock, self.p1_file_r.buffer, self.p1_file_w, 1
-
-            # 3) Wait for either socket to become readable
-            ready, _, _ = select.select([att_sock, def_sock], [], [])
-            for sock in ready:
-                # pick the right buffer + writer + slot
+            # 2) Grab current sockets and streams
+            att_sock, att_io = socks[attacker_idx], ios[attacker_idx]
+            def_sock, def_io = socks[def_slot], ios[def_slot]
+
+            # 3) Drain frames already read ahead into a stream, then wait for
+            #    either socket to become readable, up to the shot clock
+            ready = []
+            if recheck:
+                for sock, buf in ((att_sock, att_io), (def_sock, def_io)):
+                    if sock in recheck:
+                        recheck.discard(sock)
+                        if _has_buffered(sock, buf):
+                            ready.append((sock, False))
+            if not ready:
+                remaining = self._turn_deadline - monotonic()
+                if remaining <= 0:
+                    logging.info("Player %s ran out the shot clock – ending match", attacker_idx)
+                    self.drop_and_deregister(attacker_idx, reason="timeout")
+                    return None
+                ready = wait_readable((att_sock, def_sock), remaining)
+                if not ready:
+                    # Woken by a reattach (or the clock ran out): swap in any
+                    # new defender socket; the attacker's is picked up at step 1
+                    self._rebind_if_needed(def_slot)
+                    continue
+            for sock, hung_up in ready:
+                # pick the right stream + slot
                 if sock is att_sock:
-                    buf, w, slot = att_buf, att_w, attacker_idx
+                    buf, slot = att_io, attacker_idx
                 else:
-                    buf, w, slot = def_buf, def_w, def_slot
+                    buf, slot = def_io, def_slot
+                w = buf
 
-                # 4) Try to unpack one framed packet
+                # 4) Try to unpack one framed packet (a bare hang-up has none)
                 try:
+                    if hung_up:
+                        raise IncompleteError("peer hung up")
                     ptype, seq, obj = unpack(buf)
+                    recheck.add(sock)
                 except Exception:
                     # defender disconnected? handle reconnect early
-                    if sock is def_sock and self._handle_disconnects([def_slot]):
-                        return None
+                    if sock is def_sock:
+                        if self._handle_disconnects([def_slot]):
+                            return None
+                        # The attacker's clock ran on while we waited for the
+                        # defender; re-prompt so it restarts from full
+                        self._prompt_current_player(restart_clock=True)
+                        continue
                     # attacker disconnected? handle reconnect or end match
                     if sock is att_sock and self._handle_disconnects([attacker_idx]):
                         return None
@@ -513,13 +735,10 @@ class GameSession(threading.Thread):
                 # 6) Out-of-turn chat
                 if isinstance(cmd, ChatCommand):
                     # Use player PID token instead of generic slot name
-                    name = self.token_p1 if slot == 1 else self.token_p2
-                    self.io_seq = chat_broadcast(
-                        [self.p1_file_w, self.p2_file_w], self.io_seq,
-                        name, cmd.text, {"name": name, "msg": cmd.text},
-                    )
+                    name = self._tokens[slot]
+                    self.io_seq = chat_broadcast([self.p1_io, self.p2_io], self.io_seq, {"name": name, "msg": cmd.text})
                     self._broadcast(None, {"type": "chat", "name": name, "msg": cmd.text})
-                    self._emit(Event(Category.CHAT, "line", {"player": slot, "msg": cmd.text}))
+                    self._emit(Category.CHAT, "line", {"player": slot, "msg": cmd.text})
                     self._prompt_current_player()
                     break
 
@@ -539,13 +758,14 @@ class GameSession(threading.Thread):
                         self._notify(w, "ERR Not your turn – wait for prompt")
                         break
                     # duplicate shot?
-                    coord = (cmd.row, cmd.col)
-                    if coord in self._fired[attacker_idx]:
+                    bit = cmd.row * size + cmd.col
+                    mask = fired[attacker_idx]
+                    if mask >> bit & 1:
                         self._notify(w, f"ERR Already fired at {format_coord(cmd.row, cmd.col)}")
                         self._prompt_current_player()
                         break
                     # record and deliver to run()
-                    self._fired[attacker_idx].add(coord)
+                    fired[attacker_idx] = mask | (1 << bit)
                     return cmd
                 # else: ignore non-command frames
             # end for ready sockets → loop back
@@ -554,13 +774,29 @@ class GameSession(threading.Thread):
     # -------------------- shot execution --------------------
     def _execute_shot(self, current_player: int, row: int, col: int) -> None:
         """
-        Executes a shot: sends feedback to both clients, handles defender reconnect
-        immediately if their socket is closed, then broadcasts shot, updates boards.
+        Executes a shot: sends feedback to both clients, then broadcasts the
+        shot and updates boards.
+
+        Frames are buffered per player and flushed together once the shot is
+        fully processed, so each side gets one write instead of one per frame.
         """
-        # Determine attacker/defender
-        defender_board = self.board_p2 if current_player == 1 else self.board_p1
-        defender_w = self.p2_file_w if current_player == 1 else self.p1_file_w
-        attacker_w = self.p1_file_w if current_player == 1 else self.p2_file_w
+        try:
+            self._shot_frames(current_player, row, col)
+        finally:
+            self._flush_streams()
+
+    def _flush_streams(self) -> None:
+        """Push any frames still buffered on either player stream."""
+        for stream in (self.p1_io, self.p2_io):
+            with contextlib.suppress(Exception):
+                stream.flush()
+
+    def _shot_frames(self, current_player: int, row: int, col: int) -> None:
+        # Determine attacker/defender; bind hot attributes to locals once
+        defender_idx = 3 - current_player
+        defender_board = self._boards[defender_idx]
+        defender_w = self._ios[defender_idx]
+        attacker_w = self._ios[current_player]
 
         # Fire on the board
         result, sunk_name = defender_board.fire_at(row, col)
@@ -568,33 +804,25 @@ class GameSession(threading.Thread):
         coord_txt = format_coord(row, col)
 
         # Send hit/miss to attacker & defender
-        you_text = f"YOU {'HIT' if result=='hit' else 'MISSED'} at {coord_txt}"
-        opp_text = f"OPPONENT {'HIT' if result=='hit' else 'MISSED'} at {coord_txt}"
-        io_send(attacker_w, self.io_seq, PacketType.GAME, msg=you_text)
-        self.io_seq += 1
-        ok = io_send(defender_w, self.io_seq, PacketType.GAME, msg=opp_text)
-        self.io_seq += 1
-
-        # Defender dropped? do reconnect + single-board logic
-        if not ok:
-            # If reconnect failed (match ended), bail out
-            if self._handle_disconnects([2 if current_player == 1 else 1]):
-                return
-            # Defender rejoined successfully: skip the normal refresh_views
-            # (they already got the boards via _sync_state)
-            reconnected = True
-        else:
-            reconnected = False
+        outcome = "hit" if result == "hit" else "miss"
+        you_text = _YOU_FMT[outcome] % coord_txt
+        opp_text = _OPP_FMT[outcome] % coord_txt
+        seq = self.io_seq
+        io_send(attacker_w, seq, PacketType.GAME, msg=you_text, flush=False)
+        # A defender hang-up while we waited was already routed through
+        # _handle_disconnects by _await_command; a later one surfaces there on
+        # the next turn, since these frames are only buffered until the flush
+        io_send(defender_w, seq + 1, PacketType.GAME, msg=opp_text, flush=False)
+        self.io_seq = seq + 2
 
         # Sunk notification (display in red)
         if sunk_name:
             # Color the SUNK message red
-            sunk_msg = f"SUNK {sunk_name}"
-            red_msg = f"\033[91m{sunk_msg}\033[0m"
-            io_send(attacker_w, self.io_seq, PacketType.GAME, msg=red_msg)
-            self.io_seq += 1
-            io_send(defender_w, self.io_seq, PacketType.GAME, msg=red_msg)
-            self.io_seq += 1
+            red_msg = _SUNK_FMT % sunk_name
+            seq = self.io_seq
+            io_send(attacker_w, seq, PacketType.GAME, msg=red_msg, flush=False)
+            io_send(defender_w, seq + 1, PacketType.GAME, msg=red_msg, flush=False)
+            self.io_seq = seq + 2
 
         # Broadcast shot to spectators
         self._broadcast(None, {
@@ -605,20 +833,17 @@ class GameSession(threading.Thread):
             "sunk": sunk_name,
         })
 
-        # If defender has just rejoined, avoid sending a second grid snapshot
-        if reconnected:
-            return
-
-        # Otherwise do the normal board refresh
-        ok1, ok2, self.io_seq = refresh_views(
-            self.p1_file_w, self.p2_file_w, self.io_seq, self.board_p1, self.board_p2
-        )
+        # Push just the one cell that changed: the attacker's view of
+        # the enemy board and the defender's own fleet. Full grids are only
+        # sent at match start and on reconnect (_sync_state).
+        seq = self.io_seq
+        send_cell(attacker_w, seq, row, col, outcome, view="opp", flush=False)
+        send_cell(defender_w, seq + 1, row, col, outcome, view="own", flush=False)
+        self.io_seq = seq + 2
         # Send a full dual‐board update every two half‐turns
         self._half_turn_counter += 1
         if self._half_turn_counter % 2 == 0:
-            rows_p1 = grid_rows(self.board_p1, reveal=True)
-            rows_p2 = grid_rows(self.board_p2, reveal=True)
-            self._broadcast(None, {"type": "spec_grid", "rows_p1": rows_p1, "rows_p2": rows_p2})
+            self._publish_spec_grid()
 
 
 # End of GameSession module
@@ -1,8 +1,10 @@
+import contextlib
 import pytest
 import socket
 import threading
 from beer.session import GameSession
-from beer.server import PID_REGISTRY
+from beer.server import PID_REGISTRY, SpectatorFanout
+from beer import common
 from beer.common import recv_pkt, pack, PacketType
 import logging
 
@@ -10,11 +12,22 @@ import logging
 logging.basicConfig(level=logging.WARNING)
 
 
+@pytest.fixture(autouse=True)
+def _restore_encryption_key():
+    """Put beer.common's key back after each test so encryption never leaks on."""
+    orig_key = common._SECRET_KEY
+    yield
+    common._SECRET_KEY = orig_key
+
+
 class TestClient:
     """Simple client wrapper for integration tests over framed protocol."""
 
     def __init__(self, sock: socket.socket) -> None:
         self.sock = sock
+        # One reader for the client's lifetime: a fresh makefile per call
+        # would drop whatever the previous one had already buffered
+        self._reader = sock.makefile("rb")
 
     def send(self, msg: str) -> None:
         """Send a framed GAME packet with the given message."""
@@ -22,32 +35,67 @@ class TestClient:
         data = pack(PacketType.GAME, 0, {"msg": msg.strip()})
         self.sock.sendall(data)
 
+    def recv_frame(self, timeout: float = 2.0):
+        """Return the next decoded ``(ptype, seq, obj)`` frame from the shared reader."""
+        self.sock.settimeout(timeout)
+        return recv_pkt(self._reader)
+
     def recv_until(self, token: str, timeout: float = 2.0) -> str:
         """Read BEER protocol frames until the token appears in a decoded message."""
         self.sock.settimeout(timeout)
-        buf = ""
-        reader = self.sock.makefile("rb")
+        lines: list[str] = []
+        wanted = token.upper()
         try:
             while True:
-                ptype, seq, obj = recv_pkt(reader)
+                ptype, seq, obj = recv_pkt(self._reader)
                 msg = obj.get("msg", "") if isinstance(obj, dict) else ""
-                buf += msg + "\n"
-                if token.upper() in msg.upper():
+                lines.append(msg + "\n")
+                if wanted in msg.upper():
                     break
         except socket.timeout:
             pass
-        return buf
+        return "".join(lines)
 
     def close(self) -> None:
         """Close the underlying socket."""
+        self._reader.close()
         self.sock.close()
 
 
+def _tracked(make, release):
+    """Yield-fixture body for a factory whose products are released at teardown.
+
+    *make* returns ``(result, handle)``: the factory hands *result* to the
+    test and passes each *handle* to *release* once the test is done.
+    """
+    handles = []
+
+    def _factory(*args, **kwargs):
+        result, handle = make(*args, **kwargs)
+        handles.append(handle)
+        return result
+
+    yield _factory
+
+    for handle in handles:
+        release(handle)
+
+
+@pytest.fixture
+def started_sessions() -> dict:
+    """Sessions started by this test's game_factory, keyed by player token."""
+    return {}
+
+
 @pytest.fixture
-def game_factory() -> callable:
-    """Factory that sets up a GameSession and returns two TestClients and the session."""
+def game_factory(started_sessions) -> callable:
+    """Factory that sets up a GameSession and returns two TestClients and the session.
+
+    Sessions are hung up at teardown so their threads wind down instead of
+    lingering into later tests waiting out shot clocks and reconnect windows.
+    """
 
-    def _factory():
+    def _make():
         # Create server/client socket pairs for two players
         s1_srv, s1_cli = socket.socketpair()
         s2_srv, s2_cli = socket.socketpair()
@@ -66,25 +114,95 @@ def game_factory() -> callable:
             broadcast=lambda *_: None,
         )
         sess.start()
-        # Wait for initial handshake and placement to complete
-        session_ready.wait(timeout=2.0)
+        # Wait for initial handshake and placement to complete; Event.wait
+        # returns at once if it was already set, so only a real stall fails
+        assert session_ready.wait(timeout=2.0), "session never signalled ready"
         # Wrap client ends
         c1 = TestClient(s1_cli)
         c2 = TestClient(s2_cli)
-        return c1, c2, sess
+        started_sessions[t1] = started_sessions[t2] = sess
+        return (c1, c2, sess), (sess, c1, c2)
 
-    return _factory
+    def _release(handle):
+        sess, *clients = handle
+        # No reconnect grace: hanging up both players lets the match conclude
+        # now (shut down the session's side too, a test may have reconnected)
+        sess.recon.timeout = 0
+        for client in clients:
+            client.close()
+        for sock in (sess.p1_sock, sess.p2_sock):
+            with contextlib.suppress(OSError):
+                sock.shutdown(socket.SHUT_RDWR)
+        PID_REGISTRY.pop(sess.token_p1, None)
+        PID_REGISTRY.pop(sess.token_p2, None)
+
+    yield from _tracked(_make, _release)
 
 
 @pytest.fixture
-def reconnect_client() -> callable:
+def reconnect_client(started_sessions) -> callable:
     """Helper to simulate a reconnecting client by token."""
 
-    def _reconnect(token: str):
-        # Attach a fresh server-side socket to the ReconnectController
-        rc = PID_REGISTRY[token]
+    def _make(token: str):
+        # Attach a fresh server-side socket to the session's own
+        # ReconnectController rather than going through the global registry
+        rc = started_sessions[token].recon
         srv_sock, cli_sock = socket.socketpair()
         rc.attach_player(token, srv_sock)
-        return TestClient(cli_sock)
+        client = TestClient(cli_sock)
+        return client, client
+
+    yield from _tracked(_make, TestClient.close)
 
-    return _reconnect
+
+@pytest.fixture
+def idle_session() -> callable:
+    """Factory for GameSessions over fresh socketpairs, released at teardown.
+
+    Returns ``(session, p1_client_sock, p2_client_sock)``; the session is not
+    started.  Pass *pairs* as ``((p1_srv, p1_cli), (p2_srv, p2_cli))`` to use
+    sockets the test has already prepared; other keywords go to GameSession.
+    """
+
+    def _make(token_p1: str, token_p2: str, *, pairs=None, **kwargs):
+        (s1_srv, s1_cli), (s2_srv, s2_cli) = pairs or (socket.socketpair(), socket.socketpair())
+        kwargs.setdefault("broadcast", lambda *_: None)
+        sess = GameSession(s1_srv, s2_srv, token_p1=token_p1, token_p2=token_p2, **kwargs)
+        return (sess, s1_cli, s2_cli), (sess, s1_srv, s1_cli, s2_srv, s2_cli)
+
+    def _release(handle):
+        sess, *socks = handle
+        if sess.ident is not None:
+            sess.join(timeout=2.0)
+        sess.close()
+        for sock in socks:
+            sock.close()
+        PID_REGISTRY.pop(sess.token_p1, None)
+        PID_REGISTRY.pop(sess.token_p2, None)
+
+    yield from _tracked(_make, _release)
+
+
+@pytest.fixture
+def start_fanout() -> callable:
+    """Start SpectatorFanout threads that are closed again at teardown."""
+
+    def _make(sink, flush=None):
+        fanout = SpectatorFanout(sink, flush)
+        fanout.start()
+        return fanout, fanout
+
+    def _release(fanout):
+        fanout.close(timeout=2.0)
+        assert not fanout.is_alive()
+
+    yield from _tracked(_make, _release)
+
+
+@pytest.fixture
+def socket_pair():
+    """A connected ``socket.socketpair()``, both ends closed at teardown."""
+    pair = socket.socketpair()
+    yield pair
+    for sock in pair:
+        sock.close()
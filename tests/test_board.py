@@ -0,0 +1,25 @@
+from beer.battleship import Board, parse_coordinate
+
+
+def test_fleet_sunk_only_after_last_ship_cell_is_hit():
+    board = Board()
+    board.place_ships_randomly([("Destroyer", 2), ("Submarine", 3)])
+    cells = sorted(pos for ship in board.placed_ships for pos in ship["positions"])
+    assert len(cells) == 5
+    # Misses and repeat shots never sink anything
+    water = next((r, c) for r in range(board.size) for c in range(board.size) if (r, c) not in cells)
+    assert board.fire_at(*water) == ("miss", None)
+    for r, c in cells[:-1]:
+        assert board.fire_at(r, c)[0] == "hit"
+        assert not board.all_ships_sunk()
+        assert board.fire_at(r, c) == ("already_shot", None)
+    assert board.fire_at(*cells[-1])[0] == "hit"
+    assert board.all_ships_sunk()
+
+
+def test_parse_coordinate_is_memoised():
+    assert parse_coordinate(" b7 ") == (1, 6)
+    assert parse_coordinate("J10") == (9, 9)
+    hits = parse_coordinate.cache_info().hits
+    assert parse_coordinate("J10") == (9, 9)
+    assert parse_coordinate.cache_info().hits == hits + 1
@@ -0,0 +1,31 @@
+def _next_cell(client):
+    """Read frames from *client* until a `type=cell` delta arrives."""
+    while True:
+        _, _, obj = client.recv_frame()
+        if isinstance(obj, dict) and obj.get("type") == "cell":
+            return obj
+
+
+def test_shot_sends_single_cell_delta_to_both_players(game_factory):
+    c1, c2, sess = game_factory()
+    c1.recv_until("YOUR TURN")
+    state = "hit" if sess.board_p2.hidden_grid[0][0] != "." else "miss"
+    c1.send("FIRE A1")
+    assert _next_cell(c1) == {"type": "cell", "view": "opp", "row": 0, "col": 0, "state": state}
+    assert _next_cell(c2) == {"type": "cell", "view": "own", "row": 0, "col": 0, "state": state}
+
+
+def test_match_start_sends_all_views_in_one_init_state_frame(game_factory):
+    c1, c2, sess = game_factory()
+    frames = []
+    while True:
+        _, _, obj = c1.recv_frame()
+        frames.append(obj)
+        if "YOUR TURN" in obj.get("msg", ""):
+            break
+    states = [f for f in frames if f.get("type") == "init_state"]
+    assert len(states) == 1
+    assert not any(f.get("type") in ("grid", "opp_grid") for f in frames)
+    assert states[0]["own"] == [" ".join(r) for r in sess.board_p1.hidden_grid]
+    assert states[0]["opp_hidden"] == [" ".join(r) for r in sess.board_p2.hidden_grid]
+    assert all(set(row) <= {".", " "} for row in states[0]["opp_fog"])
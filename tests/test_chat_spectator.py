@@ -1,6 +1,5 @@
 import socket
-from beer.io_utils import send
-from beer.common import PacketType
+from beer.common import PacketType, pack
 from conftest import TestClient
 
 # prevent pytest from treating this helper as a test class
@@ -15,11 +14,10 @@ def test_chat_visible_to_spectator(game_factory):
     spec_srv, spec_cli = socket.socketpair()
     spec = TestClient(spec_cli)
 
-    # Override GameSession._broadcast so chat frames go to our spectator
+    # Override GameSession._broadcast so chat frames go to our spectator as
+    # one pre-framed sendall each (no file wrapper or peer probe per frame)
     # NOTE: new signature is (msg, obj)
-    sess._broadcast = lambda msg, obj=None: send(
-        spec_srv.makefile("w"), 0, PacketType.CHAT, obj=obj
-    )
+    sess._broadcast = lambda msg, obj=None: spec_srv.sendall(pack(PacketType.CHAT, 0, obj))
 
     # 1) Player 1 → delivered to Player 2 and spectator
     msg1 = "FROM_P1"
@@ -36,6 +34,12 @@ def test_chat_visible_to_spectator(game_factory):
     # 3) Spectator → should NOT deliver to either player
     spec_msg = "FROM_SPEC"
     spec.send(f"CHAT {spec_msg}\n")
-    # use a short timeout so we don't block long
-    assert spec_msg not in c1.recv_until(spec_msg, timeout=0.1)
-    assert spec_msg not in c2.recv_until(spec_msg, timeout=0.1)
+    # Fence each player with a chat from the other instead of waiting out a
+    # timeout: everything relayed before the fence arrives ahead of it
+    c2.send("CHAT FENCE_P2\n")
+    assert spec_msg not in c1.recv_until("FENCE_P2")
+    c1.send("CHAT FENCE_P1\n")
+    assert spec_msg not in c2.recv_until("FENCE_P1")
+    # The spectator gets the fences too; wait for the last so nothing is
+    # still being relayed to it once the test returns
+    assert "FENCE_P1" in spec.recv_until("FENCE_P1")
@@ -16,7 +16,9 @@ def flip_random_bit(data: bytes) -> bytes:
     idx = header_len + random.randrange(len(data) - header_len)
     # choose a random bit to flip
     bit = 1 << random.randrange(8)
-    return data[:idx] + bytes([data[idx] ^ bit]) + data[idx+1:]
+    corrupted = bytearray(data)
+    corrupted[idx] ^= bit
+    return bytes(corrupted)
 
 
 def test_crc_error_detected():
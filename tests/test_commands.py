@@ -56,3 +56,19 @@ def test_unknown_command():
 def test_empty_line():
     with pytest.raises(CommandParseError):
         parse_command("    ")
+
+
+@pytest.mark.parametrize("coord", ["A0", "A01", "A11", "J100", "K10", "@1", "AA", "A١"])
+def test_fire_rejects_malformed_coord(coord):
+    with pytest.raises(CommandParseError):
+        parse_command(f"FIRE {coord}")
+
+
+def test_fire_accepts_every_board_cell():
+    for row, letter in enumerate("ABCDEFGHIJ"):
+        for col in range(10):
+            cmd = parse_command(f"FIRE {letter.lower()}{col + 1}")
+            assert (cmd.row, cmd.col) == (row, col)
+    assert parse_command("FIRE B7") is parse_command("fire b7")
+    with pytest.raises(CommandParseError):
+        parse_command("FIRE A11")
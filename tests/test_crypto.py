@@ -40,3 +40,6 @@ def test_aes_ctr_encryption_roundtrip():
     assert ptype2 == ptype
     assert seq2 == seq
     assert obj2 == obj
+    # Same key and seq give the same keystream; another seq does not
+    assert pack(ptype, seq, obj) == pkt
+    assert pack(ptype, seq + 1, obj)[16:] != pkt[16:]
@@ -98,7 +98,8 @@ def test_mid_turn_resume(game_factory, reconnect_client):
     p1, p2, sess = game_factory()
     # Prime the game by firing first shot
     p1.send("FIRE A1\n")
-    _ = p1.recv_until("GRID")
+    # Wait for the shot result itself rather than running out a timeout
+    assert "A1" in p1.recv_until("at A1")
     # Drop attacker mid-turn
     p2.close()
     # Reconnect attacker
@@ -33,7 +33,7 @@ def test_header_and_crc_fields():
     # parse header fields
     import struct, zlib
 
-    magic, version, ptype_byte, seq_u32, length = struct.unpack(">HBBII", data[:12])
+    magic, version, ptype_byte, seq_u32, length = struct.unpack_from(">HBBII", data)
     assert magic == common.MAGIC
     assert version == common.VERSION
     assert ptype_byte == PacketType.CHAT.value
@@ -41,7 +41,7 @@ def test_header_and_crc_fields():
     payload = data[16:]
     assert length == len(payload)
     # verify CRC
-    crc_expected = struct.unpack(">I", data[12:16])[0]
+    (crc_expected,) = struct.unpack_from(">I", data, 12)
     crc_actual = zlib.crc32(data[:12] + payload) & 0xFFFFFFFF
     assert crc_actual == crc_expected
 
@@ -81,6 +81,34 @@ def test_crc_mismatch_raises_CrcError():
         unpack(BytesIO(corrupt))
 
 
+def test_unpack_reads_back_to_back_frames():
+    first = pack(PacketType.GAME, 1, {"msg": "one"})
+    second = pack(PacketType.CHAT, 2, {"text": "two"})
+    stream = BytesIO(first + second[:-1])
+    assert unpack(stream) == (PacketType.GAME, 1, {"msg": "one"})
+    with pytest.raises(IncompleteError):
+        unpack(stream)
+
+
+def test_stream_resumes_after_bad_frame():
+    import io
+
+    good = pack(PacketType.GAME, 3, {"msg": "after"})
+    corrupt = bytearray(pack(PacketType.GAME, 2, {"msg": "flipped"}))
+    corrupt[-2] ^= 0xFF
+    bad_magic = bytearray(pack(PacketType.GAME, 1, {}))
+    bad_magic[0] ^= 0xFF
+    data = bytes(bad_magic[:HEADER_LEN] + corrupt + good)
+    for stream in (BytesIO(data), io.BufferedReader(io.BytesIO(data))):
+        with pytest.raises(FrameError):
+            unpack(stream)
+        with pytest.raises(CrcError):
+            unpack(stream)
+        assert unpack(stream) == (PacketType.GAME, 3, {"msg": "after"})
+        with pytest.raises(IncompleteError):
+            unpack(stream)
+
+
 def test_send_pkt_and_recv_pkt_roundtrip():
     buf = BytesIO()
     send_pkt(buf, PacketType.CHAT, 99, {"text": "ping"})
@@ -119,3 +147,29 @@ def test_multiple_frames_stream():
     p2, s2, o2 = recv_pkt(buf)
     assert p1 == PacketType.GAME and s1 == 1 and o1 == {"msg": 1}
     assert p2 == PacketType.CHAT and s2 == 2 and o2 == {"msg": 2}
+
+
+def test_msg_fast_path_matches_generic_encoding():
+    import json
+
+    text = 'café "quoted" \\ \033[91mSUNK\033[0m'
+    data = pack(PacketType.GAME, 3, {"msg": text})
+    assert data[HEADER_LEN:] == json.dumps({"msg": text}, separators=(",", ":")).encode()
+    assert unpack(BytesIO(data))[2] == {"msg": text}
+
+
+def test_repeated_msg_payload_is_encoded_once():
+    common._msg_payload.cache_clear()
+    first = pack(PacketType.GAME, 1, {"msg": "INFO YOUR TURN"})
+    second = pack(PacketType.GAME, 2, {"msg": "INFO YOUR TURN"})
+    assert common._msg_payload.cache_info().hits == 1
+    # Same payload, but header/CRC still follow the seq
+    assert first[HEADER_LEN:] == second[HEADER_LEN:]
+    assert unpack(BytesIO(second))[1:] == (2, {"msg": "INFO YOUR TURN"})
+
+
+def test_pack_accepts_pre_encoded_payload():
+    obj = {"name": "PID1", "msg": "hi"}
+    encoded = common.encode_payload(obj)
+    assert pack(PacketType.CHAT, 7, encoded) == pack(PacketType.CHAT, 7, obj)
+    assert unpack(BytesIO(pack(PacketType.CHAT, 8, encoded)))[1:] == (8, obj)
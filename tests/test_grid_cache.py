@@ -0,0 +1,60 @@
+from beer.battleship import Board
+from beer.io_utils import grid_rows
+
+
+def test_grid_rows_cached_until_board_changes():
+    board = Board()
+    board.do_place_ship(0, 0, 2, 0, "D")
+    first = grid_rows(board, reveal=True)
+    assert first[0].startswith("D D .")
+    # Unchanged board → same rendered rows object
+    assert grid_rows(board, reveal=True) is first
+
+    board.fire_at(0, 0)
+    rows = grid_rows(board, reveal=True)
+    assert rows is not first
+    assert rows[0].startswith("X D .")
+    assert grid_rows(board)[0].startswith("X . .")
+
+
+def test_grid_rows_repeat_shot_keeps_cache():
+    board = Board()
+    board.fire_at(5, 5)
+    rows = grid_rows(board)
+    assert board.fire_at(5, 5) == ("already_shot", None)
+    assert grid_rows(board) is rows
+
+
+def test_spec_grid_republished_only_after_a_board_changes(idle_session):
+    sent = []
+    sess, _, _ = idle_session("GC1", "GC2", broadcast=lambda msg, obj=None: sent.append(obj))
+    sess._publish_spec_grid()
+    sess._publish_spec_grid()
+    assert len(sent) == 1
+    sess.board_p2.fire_at(0, 0)
+    sess._publish_spec_grid()
+    assert len(sent) == 2
+    assert sent[-1]["rows_p2"][0].startswith("o")
+
+
+def test_spec_grid_not_rendered_without_audience(idle_session):
+    sent = []
+    watching = [False]
+    sess, _, _ = idle_session(
+        "GC3", "GC4", broadcast=lambda msg, obj=None: sent.append(obj), audience=lambda: watching[0]
+    )
+    sess._publish_spec_grid()
+    assert sent == [] and sess.spec_snapshot is None
+    watching[0] = True
+    sess._publish_spec_grid()
+    assert len(sent) == 1 and sess.spec_snapshot is not None
+
+
+def test_spec_view_renders_boards_nobody_was_watching(idle_session):
+    sess, _, _ = idle_session("GC5", "GC6", audience=lambda: False)
+    sess.board_p2.fire_at(0, 0)
+    sess._publish_spec_grid()
+    rows_p1, rows_p2 = sess.spec_view()
+    assert rows_p2[0].startswith("o") and len(rows_p1) == 10
+    # Rendered off the match thread, so the boards' caches stay untouched
+    assert sess.board_p2._render_cache == {}
@@ -0,0 +1,46 @@
+import socket
+
+from beer.common import PacketType, pack, recv_pkt
+
+
+def _read_until(client, token):
+    """Return True once a frame whose msg contains *token* arrives, False on timeout."""
+    while True:
+        try:
+            _, _, obj = client.recv_frame()
+        except socket.timeout:
+            return False
+        if isinstance(obj, dict) and token in obj.get("msg", ""):
+            return True
+
+
+def test_frames_sent_back_to_back_are_all_handled(game_factory):
+    c1, c2, sess = game_factory()
+    assert _read_until(c1, "YOUR TURN")
+    # Both frames arrive in one segment; the FIRE must not wait for more input
+    burst = pack(PacketType.GAME, 0, {"msg": "CHAT hi"}) + pack(PacketType.GAME, 1, {"msg": "FIRE A1"})
+    c1.sock.sendall(burst)
+    assert _read_until(c1, "at A1")
+
+
+def test_session_adopts_streams_with_frames_already_buffered(idle_session):
+    import threading
+
+    s1_srv, s1_cli = socket.socketpair()
+    pair2 = socket.socketpair()
+    # Handshake and the first command arrive together, as from a quick client
+    s1_cli.sendall(pack(PacketType.GAME, 0, {"token": "ADOPT1"}) + pack(PacketType.GAME, 1, {"msg": "QUIT"}))
+    lobby_stream = s1_srv.makefile("rwb", buffering=65536)
+    assert recv_pkt(lobby_stream)[2] == {"token": "ADOPT1"}
+    sess, _, _ = idle_session(
+        "ADOPT1",
+        "ADOPT2",
+        pairs=((s1_srv, s1_cli), pair2),
+        io_p1=lobby_stream,
+        session_ready=threading.Event(),
+    )
+    assert sess.p1_io is lobby_stream
+    sess.start()
+    sess.join(timeout=5.0)
+    assert not sess.is_alive()
+    assert sess.winner == 2 and sess.win_reason == "concession"
@@ -43,3 +43,15 @@ def test_requeue_multiple_matches():
     # Next match: previous loser wins
     requeue_players(lobby, l1, w1, "hit")
     assert lobby[0] == l1 and lobby[-1] == w1
+
+
+def test_requeue_into_deque_lobby():
+    from collections import deque
+
+    waiting = (make_dummy("s1"), "t5")
+    lobby = deque([waiting])
+    winner = (make_dummy("w3"), "t6")
+    loser = (make_dummy("l3"), "t7")
+    requeue_players(lobby, winner, loser, "hit")
+    assert list(lobby) == [winner, waiting, loser]
+    assert lobby.popleft() == winner
@@ -1,29 +1,43 @@
 import pytest
-import socket
 
 from beer.reconnect_controller import ReconnectController
 
 
-def test_attach_once_succeeds_and_duplicate_rejected():
+def test_attach_once_succeeds_and_duplicate_rejected(socket_pair):
     registry = {}
     # Dummy notify function
     notify = lambda slot, msg: None
     rc = ReconnectController(0.1, notify, "tok1", "tok2", registry)
-    sock1 = socket.socket()
-    try:
-        assert rc.attach_player("tok1", sock1) is True
-        sock2 = socket.socket()
-        assert rc.attach_player("tok1", sock2) is False
-    finally:
-        sock1.close()
+    first, second = socket_pair
+    assert rc.attach_player("tok1", first) is True
+    assert rc.attach_player("tok1", second) is False
 
 
-def test_unknown_token_rejected():
+def test_unknown_token_rejected(socket_pair):
     registry = {}
     notify = lambda slot, msg: None
     rc = ReconnectController(0.1, notify, "tokA", "tokB", registry)
-    sock = socket.socket()
-    try:
-        assert rc.attach_player("badtoken", sock) is False
-    finally:
-        sock.close()
+    assert rc.attach_player("badtoken", socket_pair[0]) is False
+
+
+def test_reattach_wakes_a_turn_blocked_on_the_old_socket(game_factory, reconnect_client):
+    # The old connection never closes, so only the reattach can end the wait
+    c1, c2, sess = game_factory()
+    c1.recv_until("YOUR TURN")
+    old = sess.p1_sock
+    c1b = reconnect_client("FACTORY1")
+    out = c1b.recv_until("YOUR TURN", timeout=2.0)
+    assert "YOUR TURN" in out
+    assert sess.p1_sock is not old and sess.is_alive()
+    # The replaced connection is released, not left for the GC
+    assert old.fileno() == -1
+
+
+def test_rejoin_acknowledged_on_the_new_connection(game_factory, reconnect_client):
+    c1, c2, sess = game_factory()
+    c1.recv_until("YOUR TURN")
+    c1.close()
+    c1b = reconnect_client("FACTORY1")
+    out = c1b.recv_until("YOUR TURN", timeout=2.0)
+    assert "You have reconnected" in out
+    assert "Opponent has reconnected" in c2.recv_until("Opponent has reconnected")
@@ -0,0 +1,44 @@
+import time
+
+import beer.session as session_mod
+
+
+def test_attacker_times_out_when_shot_clock_expires(game_factory, monkeypatch):
+    # Shrink the shot clock so the idle attacker forfeits quickly
+    monkeypatch.setattr(session_mod, "SHOT_CLOCK", 0.3)
+    c1, c2, sess = game_factory()
+    out = c2.recv_until("YOU HAVE WON", timeout=3.0)
+    assert "YOU HAVE WON" in out
+    sess.join(timeout=2.0)
+    assert sess.winner == 2
+    assert sess.win_reason == "timeout"
+
+
+def test_defender_reconnect_restarts_the_attackers_shot_clock(game_factory, reconnect_client, monkeypatch):
+    # The attacker's clock runs on while the defender is away, so a reconnect
+    # must hand the attacker a fresh one rather than what was left of it
+    monkeypatch.setattr(session_mod, "SHOT_CLOCK", 3.0)
+    c1, c2, sess = game_factory()
+    c1.recv_until("YOUR TURN")
+    first_deadline = sess._turn_deadline
+    c2.close()
+    time.sleep(0.3)
+    c2b = reconnect_client("FACTORY2")
+    out = c1.recv_until("YOUR TURN", timeout=2.0)
+    assert "Opponent has reconnected" in out and "YOUR TURN" in out
+    assert sess._turn_deadline > first_deadline
+    c1.send("FIRE A1")
+    assert "at A1" in c1.recv_until("at A1")
+    assert "at A1" in c2b.recv_until("at A1")
+    assert sess.is_alive() and sess.winner is None
+
+
+def test_defender_chat_does_not_extend_the_attackers_turn(game_factory, monkeypatch):
+    monkeypatch.setattr(session_mod, "SHOT_CLOCK", 3.0)
+    c1, c2, sess = game_factory()
+    c1.recv_until("YOUR TURN")
+    deadline = sess._turn_deadline
+    c2.send("CHAT stalling")
+    # Chat re-prompts the attacker but leaves their clock where it was
+    assert "YOUR TURN" in c1.recv_until("YOUR TURN")
+    assert sess._turn_deadline == deadline
@@ -0,0 +1,120 @@
+import threading
+
+from beer.server import SpectatorFanout, _coalesce
+
+
+def test_coalesce_keeps_latest_grid_per_source():
+    g1 = {"type": "spec_grid", "rows_p1": ["1"], "rows_p2": []}
+    g2 = {"type": "spec_grid", "rows_p1": ["2"], "rows_p2": []}
+    shot = {"type": "shot", "coord": "A1"}
+    batch = [("m", None, g1), ("m", None, shot), (None, "INFO x", None), ("m", None, g2)]
+    assert _coalesce(batch) == [("m", None, shot), (None, "INFO x", None), ("m", None, g2)]
+
+
+def test_fanout_delivers_in_order(start_fanout):
+    got = []
+    done = threading.Event()
+
+    def sink(msg, obj=None):
+        got.append(msg)
+        if msg == "last":
+            done.set()
+
+    fanout = start_fanout(sink)
+    send = fanout.broadcast_from("m")
+    for msg in ("first", "second", "last"):
+        send(msg, None)
+    assert done.wait(timeout=2.0)
+    assert got == ["first", "second", "last"]
+
+
+def test_drain_waits_for_pending_broadcasts(start_fanout):
+    got = []
+    gate = threading.Event()
+
+    def sink(msg, obj=None):
+        gate.wait(timeout=2.0)
+        got.append(msg)
+
+    fanout = start_fanout(sink)
+    fanout.submit(None, "result")
+    gate.set()
+    assert fanout.drain(timeout=2.0)
+    assert got == ["result"]
+
+
+def test_flush_runs_once_per_batch_before_drain_returns(start_fanout):
+    events = []
+    gate = threading.Event()
+
+    def sink(msg, obj=None):
+        gate.wait(timeout=2.0)
+        events.append(msg)
+
+    fanout = start_fanout(sink, lambda: events.append("flush"))
+    fanout.submit(None, "first")
+    fanout.submit(None, "second")
+    fanout.submit(None, "third")
+    gate.set()
+    assert fanout.drain(timeout=2.0)
+    assert events[-1] == "flush"
+    assert events.count("flush") < 4
+    assert [e for e in events if e != "flush"] == ["first", "second", "third"]
+
+
+def test_grid_frame_reused_until_rows_change():
+    from beer.server import _GridFrameCache
+
+    cache = _GridFrameCache()
+    p1, p2 = [". ."], ["o ."]
+    first = cache.frame({"type": "spec_grid", "rows_p1": p1, "rows_p2": p2})
+    assert cache.frame({"type": "spec_grid", "rows_p1": p1, "rows_p2": p2}) is first
+    changed = cache.frame({"type": "spec_grid", "rows_p1": p1, "rows_p2": ["o X"]})
+    assert changed is not first and changed != first
+
+
+def test_pending_flush_is_retried_without_new_broadcasts(start_fanout):
+    calls = []
+    retried = threading.Event()
+
+    def flush():
+        calls.append(1)
+        if len(calls) >= 3:
+            retried.set()
+            return False
+        return True
+
+    fanout = start_fanout(lambda msg, obj=None: None, flush)
+    fanout.submit(None, "only")
+    assert retried.wait(timeout=2.0)
+
+
+def test_broadcast_from_drops_items_without_audience(start_fanout):
+    got = []
+    watching = [False]
+    fanout = start_fanout(lambda msg, obj=None: got.append(msg))
+    send = fanout.broadcast_from("m", lambda: watching[0])
+    send("unseen", None)
+    watching[0] = True
+    send("seen", None)
+    assert fanout.drain(timeout=2.0)
+    assert got == ["seen"]
+
+
+def test_call_soon_runs_on_the_fanout_thread_after_earlier_items(start_fanout):
+    events = []
+    fanout = start_fanout(lambda msg, obj=None: events.append(msg), lambda: events.append("flush"))
+    fanout.submit(None, "before")
+    fanout.call_soon(lambda: events.append(threading.current_thread() is fanout))
+    assert fanout.drain(timeout=2.0)
+    assert events[:3] == ["before", "flush", True]
+
+
+def test_close_delivers_queued_items_then_stops():
+    got = []
+    fanout = SpectatorFanout(lambda msg, obj=None: got.append(msg))
+    fanout.start()
+    fanout.submit(None, "last words")
+    fanout.close(timeout=2.0)
+    assert got == ["last words"]
+    assert not fanout.is_alive()